@@ -0,0 +1,66 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled answer-text cleaning for main.py
+Same result as OCRProcessor.clean_answer_text, without the regex engine:
+leading bubble chars are skipped with a plain loop over code points
+
+Build:
+    python setup.py build_ext --inplace
+
+Keep the character sets below in sync with the OCRProcessor patterns
+"""
+
+from cpython.unicode cimport Py_UNICODE_ISSPACE
+
+
+cdef inline bint _is_bubble(Py_UCS4 c):
+    # _LEADING_BUBBLE_RE main class, including its IGNORECASE case variants
+    return c in u'0BHIMNOPbhimnopİıΦφϕБИМНОПФбимнопфᲂ○●◯⚪⚫'
+
+
+cdef inline bint _is_bubble_tail(Py_UCS4 c):
+    # _LEADING_BUBBLE_RE trailing [IiІі]* (IGNORECASE)
+    return c in u'IiİıІі'
+
+
+cdef inline bint _is_artifact(Py_UCS4 c):
+    # _ANSWER_ARTIFACT_RE single leftover bubble char
+    return c in u'0oOоОФфΦφMМмBbБбИиIi'
+
+
+cpdef str clean_answer_text(str text):
+    """Enhanced answer cleaning - removes ALL bubble variations"""
+    cdef str original = text.strip()
+    cdef str cleaned = original
+    cdef Py_ssize_t n = len(original)
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t j
+
+    # Strip the leading bubble only if enough text remains after it
+    while i < n and _is_bubble(original[i]):
+        i += 1
+    if i > 0:
+        while i < n and _is_bubble_tail(original[i]):
+            i += 1
+        while i < n and Py_UNICODE_ISSPACE(original[i]):
+            i += 1
+        if n - i > 2:
+            cleaned = original[i:]
+
+    # Remove remaining artifacts
+    n = len(cleaned)
+    if n:
+        i = 0
+        if n > 1 and _is_artifact(cleaned[0]) and Py_UNICODE_ISSPACE(cleaned[1]):
+            i = 2
+            while i < n and Py_UNICODE_ISSPACE(cleaned[i]):
+                i += 1
+        j = i
+        while j < n and cleaned[j] in u'.,-':
+            j += 1
+        if j > i:
+            while j < n and Py_UNICODE_ISSPACE(cleaned[j]):
+                j += 1
+        cleaned = ' '.join(cleaned[j:].split())
+
+    return cleaned if len(cleaned) > 2 else original
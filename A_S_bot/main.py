@@ -21,111 +21,535 @@ TODO: Import json DB
     -
 """
 
-import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox
 import cv2
 import numpy as np
 import pytesseract
-from PIL import Image, ImageTk, ImageEnhance
+from PIL import Image
 import pyautogui
 import sqlite3
 import json
 import os
+import sys
+import ctypes
 import time
 import threading
+import queue
+import functools
+import itertools
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from fuzzywuzzy import fuzz
+from rapidfuzz import fuzz, process
 import re
-from collections import defaultdict
+from collections import defaultdict, deque, OrderedDict
 from typing import List, Dict, Tuple, Optional
 
+# Optional JIT for the contour classification and selection-pixel loops
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+# Single-threaded Tesseract (tesserocr and tesseract.exe both inherit this): answer
+# blocks are OCR'd by OCR_WORKERS handles side by side, and each would otherwise
+# start its own OpenMP team and oversubscribe the CPU
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+# Optional in-process Tesseract API (avoids one tesseract.exe spawn per OCR call)
+try:
+    from tesserocr import PyTessBaseAPI, PSM, OEM, RIL, iterate_level
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+# Optional fast screen capture (BitBlt straight into a buffer, no PIL)
+try:
+    import mss
+    MSS_AVAILABLE = True
+except ImportError:
+    MSS_AVAILABLE = False
+
+# Optional global mouse hook (event-driven answer-click detection)
+try:
+    from pynput import mouse
+    PYNPUT_AVAILABLE = True
+except ImportError:
+    PYNPUT_AVAILABLE = False
+
+# Optional fast hash for image change detection / OCR caching
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Optional streaming JSON parser (imports without loading the whole file)
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Optional compiled answer cleaning (build with: python setup.py build_ext --inplace)
+try:
+    from fast_clean import clean_answer_text as fast_clean_answer_text
+    FAST_CLEAN_AVAILABLE = True
+except ImportError:
+    FAST_CLEAN_AVAILABLE = False
+
+# Clicks are paced by Config.CORRECTION_DELAY; drop pyautogui's own 0.1 s per call
+pyautogui.PAUSE = 0
+pyautogui.MINIMUM_DURATION = 0
+
+# GUI toolkit is imported lazily by load_gui() so code that only needs the
+# OCR / detection classes never loads Tcl/Tk
+tk = ttk = scrolledtext = messagebox = ImageTk = None
+
+
+def load_gui():
+    """Import tkinter and ImageTk into module globals (needed by AutoTestCorrector)"""
+    global tk, ttk, scrolledtext, messagebox, ImageTk
+    if tk is None:
+        import tkinter as tk
+        from tkinter import ttk, scrolledtext, messagebox
+        from PIL import ImageTk
+
+
+def image_key(img: np.ndarray) -> Tuple:
+    """Content key for an image (xxh3 when available, builtin hash otherwise)"""
+    data = np.ascontiguousarray(img)
+    if XXHASH_AVAILABLE:
+        return data.shape, xxhash.xxh3_64_intdigest(memoryview(data).cast('B'))
+    return data.shape, hash(data.tobytes())
+
+
+def sample_key(img: np.ndarray, step: int = 4) -> Tuple:
+    """
+    Exact content key of a 1-in-step pixel sample (first channel only)
+    Far fewer bytes than image_key(img); good enough to tell "identical frame"
+    """
+    sample = img[::step, ::step, 0] if img.ndim == 3 else img[::step, ::step]
+    return image_key(sample)
+
+
+def to_gray(img: np.ndarray, dst: Optional[np.ndarray] = None) -> np.ndarray:
+    """Grayscale from a gray, BGR or BGRA (raw mss) array"""
+    if img.ndim == 2:
+        return img
+    code = cv2.COLOR_BGRA2GRAY if img.shape[2] == 4 else cv2.COLOR_BGR2GRAY
+    return cv2.cvtColor(img, code, dst=dst)
+
+
+def region_hash(img: np.ndarray) -> int:
+    """
+    64-bit perceptual difference hash (dHash) of a screen region
+    9x8 gray thumbnail, one bit per horizontally adjacent pixel pair
+    Antialiasing / cursor-blink jitter flips at most a few bits
+    """
+    small = cv2.resize(to_gray(img), (9, 8), interpolation=cv2.INTER_AREA)
+    return int.from_bytes(np.packbits(small[:, 1:] > small[:, :-1]).tobytes(), 'big')
+
+
+def hash_distance(a: int, b: int) -> int:
+    """Hamming distance between two region_hash() values"""
+    return bin(a ^ b).count('1')
+
+
+def reuse_buffer(buf: Optional[np.ndarray], shape: Tuple, dtype=np.uint8) -> np.ndarray:
+    """Return buf if it already has this shape, otherwise a fresh np.empty"""
+    if buf is None or buf.shape != tuple(shape) or buf.dtype != dtype:
+        return np.empty(shape, dtype=dtype)
+    return buf
+
+
+if sys.platform == 'win32':
+    class _MOUSEINPUT(ctypes.Structure):
+        _fields_ = [("dx", ctypes.c_long), ("dy", ctypes.c_long),
+                    ("mouseData", ctypes.c_ulong), ("dwFlags", ctypes.c_ulong),
+                    ("time", ctypes.c_ulong), ("dwExtraInfo", ctypes.c_size_t)]
+
+    class _INPUT(ctypes.Structure):
+        # MOUSEINPUT is the largest member of the INPUT union, so it alone fixes the size
+        _fields_ = [("type", ctypes.c_ulong), ("mi", _MOUSEINPUT)]
+
+    _INPUT_MOUSE = 0
+    _MOUSEEVENTF_LEFTDOWN = 0x0002
+    _MOUSEEVENTF_LEFTUP = 0x0004
+    _user32 = ctypes.windll.user32
+
+
+def fast_click(x: int, y: int):
+    """
+    Left click at screen coordinates
+    Windows: SetCursorPos + one SendInput with down/up (no pyautogui overhead)
+    """
+    if sys.platform != 'win32':
+        pyautogui.click(x, y)
+        return
+
+    _user32.SetCursorPos(int(x), int(y))
+    inputs = (_INPUT * 2)(
+        _INPUT(_INPUT_MOUSE, _MOUSEINPUT(0, 0, 0, _MOUSEEVENTF_LEFTDOWN, 0, 0)),
+        _INPUT(_INPUT_MOUSE, _MOUSEINPUT(0, 0, 0, _MOUSEEVENTF_LEFTUP, 0, 0)),
+    )
+    _user32.SendInput(2, inputs, ctypes.sizeof(_INPUT))
+
+
+# Color ranges (OpenCV HSV: H 0-180). Plain tuples: cv2.inRange takes them as
+# scalars, with no per-call ndarray construction
+# Answer blocks (AnswerBlockDetector); red wraps around H=0
+HSV_GREEN_LO, HSV_GREEN_HI = (25, 20, 20), (95, 255, 255)
+HSV_RED_LOW_LO, HSV_RED_LOW_HI = (0, 20, 20), (25, 255, 255)
+HSV_RED_HIGH_LO, HSV_RED_HIGH_HI = (155, 20, 20), (180, 255, 255)
+# Selection indicators (is_answer_selected)
+HSV_SELECTED_BLUE_LO, HSV_SELECTED_BLUE_HI = (90, 50, 50), (130, 255, 255)
+HSV_SELECTED_DARK_LO, HSV_SELECTED_DARK_HI = (0, 0, 0), (180, 255, 100)
+# BGR pixels that can match neither selection range (S < 50, V > 100)
+BGR_PLAIN_WHITE_LO, BGR_PLAIN_WHITE_HI = (206, 206, 206), (255, 255, 255)
+
 
 # =====================================================================
 # UTILITY CLASSES FOR MODULAR ARCHITECTURE
 # =====================================================================
 
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Configuration management"""
-    def __init__(self):
-        self.TESSERACT_PATH = r"C:\dt\Tesseract-OCR\tesseract.exe"
-        self.DB_FILE = "test_questions.db"
-        self.FUZZY_THRESHOLD = 85  # Minimum similarity for matching
-        self.OCR_LANG = "srp+eng"  # Serbian + English
-        self.MONITOR_INTERVAL = 0.5  # Screenshot interval in seconds
-        self.CLICK_DETECT_THRESHOLD = 5  # Screen change threshold
-        self.CORRECTION_DELAY = 0.2  # Delay between auto-clicks
-
-        # Shape detection for question type
-        self.CIRCLE_MIN_CIRCULARITY = 0.7  # For radio buttons
-        self.SQUARE_MAX_CIRCULARITY = 0.5  # For checkboxes
+    """Configuration management (immutable; read on every tick)"""
+    TESSERACT_PATH: str = r"C:\dt\Tesseract-OCR\tesseract.exe"
+    DB_FILE: str = "test_questions.db"
+    FUZZY_THRESHOLD: int = 85  # Minimum similarity for matching
+    OCR_LANG: str = "srp+eng"  # Serbian + English
+    MONITOR_INTERVAL: float = 0.1  # Screenshot interval in seconds (idle ticks only hash)
+    QUESTION_HASH_THRESHOLD: int = 3  # dHash bits that may flip before a question counts as new
+    CLICK_DETECT_THRESHOLD: int = 5  # Screen change threshold
+    CLICK_HOOK: bool = True  # Wait for real mouse clicks (pynput); False = poll the screen (remote desktop)
+    CORRECTION_DELAY: float = 0.2  # Delay between auto-clicks
+    OCR_NATIVE_MIN_SIDE: int = 300  # Crops at least this big skip the 2x upscale
+    OCR_CACHE_SIZE: int = 4096  # Recent (image -> text) results kept by OCRProcessor
+    OCR_BATCH_SEPARATOR: int = 20  # White rows between crops in batched OCR
+    OCR_WORKERS: int = 4  # Threads OCR-ing answer blocks side by side (1 = inline)
+    DETECT_SCALE: float = 0.5  # Color-block detection runs on a downscaled answers frame
+    SELECT_UNIFORM_STD: float = 12.0  # Blocks with less per-channel spread are judged by their mean color
+
+    # Shape detection for question type
+    CIRCLE_MIN_CIRCULARITY: float = 0.7  # For radio buttons
+    SQUARE_MAX_CIRCULARITY: float = 0.5  # For checkboxes
 
 
 class OCRProcessor:
     """Enhanced OCR processing with Serbian support"""
 
-    def __init__(self, config: Config):
+    # Text-cleaning patterns, compiled once at class load
+    _BROJ_RE = re.compile(r"Broj potrebnih odgovora:\s*\d+", re.IGNORECASE)
+    _BUBBLE_LEADING_RE = re.compile(r'^[0oOоОФфΦφMМмBbБб○◯●]+\s*')
+    # All round/rectangular bubble variants as one anchored alternation
+    _LEADING_BUBBLE_RE = re.compile(
+        r'^(?:[0oOоОФфΦφ○◯●⚫⚪MМмBbБбИиIiПпPpНнHhNn]+[IiІі]*)\s*',
+        re.IGNORECASE
+    )
+    # Leftover single bubble char and/or leading punctuation
+    _ANSWER_ARTIFACT_RE = re.compile(r'^(?:[0oOоОФфΦφMМмBbБбИиIi]\s+)?(?:[.,-]+\s*)?')
+
+    def __init__(self, config: Config, workers: Optional[int] = None, pool_worker: bool = False):
         self.config = config
+        # pool_worker: processor of one answer-block pool thread; loads only the
+        # primary-language model and leaves the English fallback and the result
+        # cache to the processor that owns the pool
+        self._pool_worker = pool_worker
         pytesseract.pytesseract.tesseract_cmd = config.TESSERACT_PATH
+        self._gray_buf = None  # Grayscale conversion reused across calls
+        self._resize_buf = None  # Upscale destination reused across calls
+        self._text_cache = OrderedDict()  # _cache_key -> (text, confidence)
+
+        # Answer-block fan-out: Tesseract releases the GIL, but its handles and
+        # the scratch buffers above are not shareable, so every worker thread
+        # gets its own (pool-less) OCRProcessor
+        workers = min(config.OCR_WORKERS, os.cpu_count() or 1) if workers is None else workers
+        self._workers = workers
+        self._pool = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+        self._worker_local = threading.local()
+        self._worker_procs = []  # Every pool thread's processor, released by close()
+        self._worker_procs_lock = threading.Lock()
+
+        # Persistent Tesseract handles (primary language + English fallback)
+        self._api = None
+        self._api_eng = None
+        if TESSEROCR_AVAILABLE:
+            tessdata = os.path.join(os.path.dirname(config.TESSERACT_PATH), "tessdata")
+            try:
+                self._api = PyTessBaseAPI(path=tessdata, lang=config.OCR_LANG,
+                                          oem=OEM.LSTM_ONLY, psm=PSM.SINGLE_BLOCK)
+                if not pool_worker:
+                    self._api_eng = PyTessBaseAPI(path=tessdata, lang="eng",
+                                                  psm=PSM.SINGLE_BLOCK)
+            except RuntimeError as e:
+                print(f"tesserocr init failed, using pytesseract: {e}")
+                self._end_apis()  # The worker pool stays: pytesseract runs in parallel too
+
+        # Load the workers' models in the background now, not on the first question
+        if self._pool is not None:
+            barrier = threading.Barrier(workers)
+            for _ in range(workers):
+                self._pool.submit(self._warm_worker, barrier)
+
+    def close(self):
+        """Release the persistent Tesseract handles (and the worker pool with its processors)"""
+        pool = getattr(self, '_pool', None)
+        if pool is not None:
+            self._pool = None
+            pool.shutdown(wait=True)  # Workers may still be inside their handles
+        for proc in getattr(self, '_worker_procs', ()):
+            proc.close()
+        self._worker_procs = []
+        self._end_apis()
+
+    def _end_apis(self):
+        """Release only this processor's Tesseract handles"""
+        for api in (self._api, self._api_eng):
+            if api is not None:
+                api.End()
+        self._api = None
+        self._api_eng = None
+
+    def __del__(self):
+        self.close()
 
     def extract_text(self, img: np.ndarray, enhance: bool = True) -> Tuple[str, float]:
         """
         Extract text from image with optional enhancement
+        Previously seen images are served from an LRU cache without re-running OCR
         Returns: (text, confidence)
         """
+        key = None
+        if not self._pool_worker:  # Pool workers' results are cached by the parent
+            key = self._cache_key(img, enhance)
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
+
         try:
             if enhance:
                 img = self._preprocess_image(img)
 
             # Try Serbian + English first
-            text = pytesseract.image_to_string(
-                img,
-                lang=self.config.OCR_LANG,
-                config="--oem 1 --psm 6"
-            ).strip()
+            if self._api is not None:
+                text = self._recognize(self._api, img)
+            else:
+                text = pytesseract.image_to_string(
+                    img,
+                    lang=self.config.OCR_LANG,
+                    config="--oem 1 --psm 6"
+                ).strip()
 
             confidence = 75  # Baseline confidence
 
-            if not text:
+            if not text and not self._pool_worker:
                 # Fallback to English only
-                text = pytesseract.image_to_string(
-                    img,
-                    lang="eng",
-                    config="--psm 6"
-                ).strip()
+                if self._api_eng is not None:
+                    text = self._recognize(self._api_eng, img)
+                else:
+                    text = pytesseract.image_to_string(
+                        img,
+                        lang="eng",
+                        config="--psm 6"
+                    ).strip()
                 confidence = 60
 
+            if key is not None:
+                self._cache_put(key, (text, confidence))
+
             return text, confidence
 
         except Exception as e:
             print(f"OCR Error: {e}")
             return "", 0
 
+    @staticmethod
+    def _cache_key(img: np.ndarray, enhance: bool = True) -> Tuple:
+        """
+        Cache key from a 64x64 area-averaged thumbnail plus the original shape
+        Recurring answer blocks ("Tačno", stock phrases) hit even across questions
+        """
+        thumb = cv2.resize(img, (64, 64), interpolation=cv2.INTER_AREA)
+        return img.shape, image_key(thumb), enhance
+
+    def _cache_get(self, key) -> Optional[Tuple[str, float]]:
+        cached = self._text_cache.get(key)
+        if cached is not None:
+            self._text_cache.move_to_end(key)
+        return cached
+
+    def _cache_put(self, key, value: Tuple[str, float]):
+        self._text_cache[key] = value
+        if len(self._text_cache) > self.config.OCR_CACHE_SIZE:
+            self._text_cache.popitem(last=False)
+
+    def extract_text_batch(self, imgs: List[np.ndarray]) -> List[str]:
+        """
+        OCR several crops with a single Tesseract call
+        Crops are preprocessed and stacked on one white canvas; recognized
+        words are mapped back to their crop by vertical position
+        Returns one text per input crop; cached crops skip Tesseract entirely
+        """
+        keys = [self._cache_key(img) for img in imgs]
+        texts = [None] * len(imgs)
+        missing = []
+        for i, key in enumerate(keys):
+            cached = self._cache_get(key)
+            if cached is not None:
+                texts[i] = cached[0]
+            else:
+                missing.append(i)
+
+        if len(missing) < 2:
+            for i in missing:
+                texts[i] = self.extract_text(imgs[i])[0]
+            return texts
+
+        if self._pool is not None:
+            # Deal the misses round-robin over the workers, one Tesseract each
+            n = min(self._workers, len(missing))
+            groups = [missing[k::n] for k in range(n)]
+            results = self._pool.map(self._ocr_group, [[imgs[i] for i in g] for g in groups])
+            # Crops a worker left empty get extract_text here, with the English
+            # fallback only this processor loads
+            recognized = [(i, text or self.extract_text(imgs[i])[0])
+                          for g, res in zip(groups, results) for i, text in zip(g, res)]
+        else:
+            recognized = zip(missing, self._ocr_batch([imgs[i] for i in missing]))
+
+        for i, text in recognized:
+            texts[i] = text
+            # (empty crops already went through extract_text, which caches itself)
+            if text and keys[i] not in self._text_cache:
+                self._cache_put(keys[i], (text, 75))
+
+        return texts
+
+    def _ocr_group(self, imgs: List[np.ndarray]) -> List[str]:
+        """Runs on a pool thread: OCR some crops with that thread's own processor"""
+        proc = self._worker_proc()
+        if len(imgs) == 1:
+            return [proc.extract_text(imgs[0])[0]]
+        return proc._ocr_batch(imgs)
+
+    def _worker_proc(self) -> 'OCRProcessor':
+        """This pool thread's processor, created on first use"""
+        proc = getattr(self._worker_local, 'proc', None)
+        if proc is None:
+            proc = self._worker_local.proc = OCRProcessor(self.config, workers=0, pool_worker=True)
+            with self._worker_procs_lock:
+                self._worker_procs.append(proc)
+        return proc
+
+    def _warm_worker(self, barrier: threading.Barrier):
+        """Pool start-up task: load one thread's processor (the barrier keeps each task on its own thread)"""
+        self._worker_proc()
+        try:
+            barrier.wait(timeout=5)
+        except threading.BrokenBarrierError:
+            pass
+
+    def _ocr_batch(self, imgs: List[np.ndarray]) -> List[str]:
+        """Uncached body of extract_text_batch (needs at least two crops)"""
+        processed = [self._preprocess_image(img) for img in imgs]
+
+        sep = self.config.OCR_BATCH_SEPARATOR
+        width = max(p.shape[1] for p in processed)
+        height = sum(p.shape[0] for p in processed) + sep * (len(processed) + 1)
+        canvas = np.full((height, width), 255, dtype=np.uint8)
+
+        spans = []
+        y = sep
+        for p in processed:
+            h, w = p.shape[:2]
+            canvas[y:y + h, :w] = p
+            spans.append((y, y + h))
+            y += h + sep
+
+        words = [[] for _ in imgs]
+        try:
+            for word, top, bottom in self._ocr_words(canvas):
+                center = (top + bottom) // 2
+                for i, (y0, y1) in enumerate(spans):
+                    if y0 <= center < y1:
+                        words[i].append(word)
+                        break
+        except Exception as e:
+            print(f"Batch OCR Error: {e}")
+            return [self.extract_text(img)[0] for img in imgs]
+
+        texts = [' '.join(w) for w in words]
+
+        # Crops that came back empty get the single-image path (with English fallback)
+        for i, text in enumerate(texts):
+            if not text:
+                texts[i] = self.extract_text(imgs[i])[0]
+
+        return texts
+
+    def _ocr_words(self, img: np.ndarray):
+        """Yield (word, top, bottom) for every word Tesseract finds in img"""
+        if self._api is not None:
+            self._api.SetImage(Image.fromarray(img))
+            self._api.Recognize()
+            for r in iterate_level(self._api.GetIterator(), RIL.WORD):
+                word = r.GetUTF8Text(RIL.WORD)
+                if word and word.strip():
+                    _, top, _, bottom = r.BoundingBox(RIL.WORD)
+                    yield word.strip(), top, bottom
+        else:
+            data = pytesseract.image_to_data(
+                img,
+                lang=self.config.OCR_LANG,
+                config="--oem 1 --psm 6",
+                output_type=pytesseract.Output.DICT
+            )
+            for word, top, height in zip(data['text'], data['top'], data['height']):
+                if word.strip():
+                    yield word.strip(), top, top + height
+
+    @staticmethod
+    def _recognize(api, img: np.ndarray) -> str:
+        """Run OCR on a persistent tesserocr handle"""
+        api.SetImage(Image.fromarray(img))
+        return api.GetUTF8Text().strip()
+
     def _preprocess_image(self, img: np.ndarray) -> np.ndarray:
         """Preprocess image for better OCR"""
         # Convert to grayscale
         if len(img.shape) == 3:
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+            self._gray_buf = reuse_buffer(self._gray_buf, img.shape[:2])
+            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY, dst=self._gray_buf)
         else:
             gray = img
 
-        # Upscale for better recognition
-        gray = cv2.resize(gray, None, fx=2, fy=2, interpolation=cv2.INTER_LINEAR)
+        h, w = gray.shape[:2]
+        if min(h, w) >= self.config.OCR_NATIVE_MIN_SIDE:
+            # Large crops: adaptive threshold at native resolution
+            return cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+                                         cv2.THRESH_BINARY, 31, 10)
+
+        # Small crops: upscale for better recognition, then Otsu
+        self._resize_buf = reuse_buffer(self._resize_buf, (h * 2, w * 2))
+        gray = cv2.resize(gray, (w * 2, h * 2), dst=self._resize_buf,
+                          interpolation=cv2.INTER_LINEAR)
 
-        # Adaptive thresholding
         _, processed = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
 
         return processed
 
-    @staticmethod
-    def clean_question_text(text: str) -> str:
+    # Cleaners are pure str -> str and OCR output repeats (cached crops,
+    # recurring answers), so results are memoized on top of the compiled patterns
+    @classmethod
+    @functools.lru_cache(maxsize=1024)
+    def clean_question_text(cls, text: str) -> str:
         """Clean question text by removing indicators and bubble chars"""
         # Remove "Broj potrebnih odgovora: N"
-        cleaned = re.sub(
-            r"Broj potrebnih odgovora:\s*\d+",
-            "",
-            text,
-            flags=re.IGNORECASE
-        )
+        cleaned = cls._BROJ_RE.sub("", text)
 
         # Remove bubble characters from line starts
         lines = []
@@ -133,56 +557,137 @@ class OCRProcessor:
             line = line.strip()
             if line:
                 # Remove leading bubble chars
-                line = re.sub(r'^[0oOоОФфΦφMМмBbБб○◯●]+\s*', '', line)
+                line = cls._BUBBLE_LEADING_RE.sub('', line)
                 if len(line) > 3:
                     lines.append(line)
 
-        result = ' '.join(lines)
-        result = re.sub(r'\s+', ' ', result).strip()
+        result = ' '.join(' '.join(lines).split())
 
         return result if result else text
 
-    @staticmethod
-    def clean_answer_text(text: str) -> str:
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def clean_answer_text(cls, text: str) -> str:
         """Enhanced answer cleaning - removes ALL bubble variations"""
+        if FAST_CLEAN_AVAILABLE:
+            return fast_clean_answer_text(text)
+
         original = text.strip()
 
-        # Comprehensive bubble patterns
-        bubble_patterns = [
-            r'^[0oOоО]+\s*',  # Single answer bubbles (round)
-            r'^[ФфΦφ]+\s*',
-            r'^[○◯●⚫⚪]+\s*',
-            r'^[MМм]+\s*',  # Multi-answer bubbles (rectangular)
-            r'^[MМм][IiІі]+\s*',
-            r'^[БбBb]+\s*',
-            r'^[БбBb][IiІі]+\s*',
-            r'^[ИиIi]+\s*',
-            r'^[ПпPp]+\s*',
-            r'^[НнHhNn]+\s*',
-            r'^[0oOоОФфΦφ○◯●⚫⚪MМмBbБбИиIiПпPpНнHhNn]+[IiІі]*\s*',
-        ]
-
-        cleaned = original
-        for pattern in bubble_patterns:
-            new_cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-            if new_cleaned != cleaned and len(new_cleaned.strip()) > 2:
-                cleaned = new_cleaned.strip()
-                break
+        # Strip the leading bubble only if enough text remains after it
+        m = cls._LEADING_BUBBLE_RE.match(original)
+        cleaned = original[m.end():] if m and len(original) - m.end() > 2 else original
 
         # Remove remaining artifacts
         if cleaned:
-            cleaned = re.sub(r'^[0oOоОФфΦφMМмBbБбИиIi]\s+', '', cleaned)
-            cleaned = re.sub(r'^[.,-]+\s*', '', cleaned)
-            cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+            cleaned = cls._ANSWER_ARTIFACT_RE.sub('', cleaned, count=1)
+            cleaned = ' '.join(cleaned.split())
 
         return cleaned if cleaned and len(cleaned) > 2 else original
 
 
+def _classify_contours(areas, perimeters, circ_min, circ_max):
+    """
+    Count (circles, squares) among selection-box sized contours
+    Compares 4*pi*A against circularity*P^2 instead of dividing
+    """
+    circle_count = 0
+    square_count = 0
+
+    for i in prange(areas.shape[0]):
+        area = areas[i]
+        perim_sq = perimeters[i] * perimeters[i]
+        if 50.0 < area < 500.0 and perim_sq > 0.0:
+            k = 4.0 * np.pi * area
+            if k > circ_min * perim_sq:
+                circle_count += 1
+            elif k < circ_max * perim_sq:
+                square_count += 1
+
+    return circle_count, square_count
+
+
+def _classify_contours_numpy(areas, perimeters, circ_min, circ_max):
+    """Vectorized equivalent of _classify_contours for when numba is missing"""
+    mask = (areas > 50) & (areas < 500) & (perimeters > 0)
+    circularity = 4 * np.pi * areas[mask] / (perimeters[mask] ** 2)
+
+    circles = circularity > circ_min
+    squares = ~circles & (circularity < circ_max)
+
+    return int(circles.sum()), int(squares.sum())
+
+
+if NUMBA_AVAILABLE:
+    _classify_contours = njit(parallel=True, cache=True)(_classify_contours)
+else:
+    _classify_contours = _classify_contours_numpy
+
+
+def _count_selection_pixels(img):
+    """
+    (blue, dark) pixel counts of a BGR block in one pass, no HSV frame or masks
+    Same tests as the HSV_SELECTED_* inRange calls, using OpenCV's 8-bit
+    fixed-point H/S formulas so the counts match cvtColor exactly
+    Only used compiled (numba); the cv2 path in is_answer_selected is the fallback
+    """
+    n_blue = 0
+    n_dark = 0
+
+    for i in range(img.shape[0]):
+        for j in range(img.shape[1]):
+            b = np.int32(img[i, j, 0])
+            g = np.int32(img[i, j, 1])
+            r = np.int32(img[i, j, 2])
+            v = max(b, g, r)
+
+            if v <= HSV_SELECTED_DARK_HI[2]:
+                n_dark += 1
+            if v < HSV_SELECTED_BLUE_LO[2]:
+                continue
+
+            # S = round(255 * diff / V), H = round(30 * sector offset / diff) (12-bit fixed point)
+            diff = v - min(b, g, r)
+            if diff == 0:
+                continue
+            sat = (diff * np.int32(np.rint((255 << 12) / v)) + (1 << 11)) >> 12
+            if sat < HSV_SELECTED_BLUE_LO[1]:
+                continue
+
+            if v == r:
+                h = g - b
+            elif v == g:
+                h = b - r + 2 * diff
+            else:
+                h = r - g + 4 * diff
+            h = (h * np.int32(np.rint((180 << 12) / (6.0 * diff))) + (1 << 11)) >> 12
+            if h < 0:
+                h += 180
+
+            if HSV_SELECTED_BLUE_LO[0] <= h <= HSV_SELECTED_BLUE_HI[0]:
+                n_blue += 1
+
+    return n_blue, n_dark
+
+
+if NUMBA_AVAILABLE:
+    # Serial: answer blocks are a few thousand pixels, too small to pay for threads
+    _count_selection_pixels = njit(cache=True)(_count_selection_pixels)
+
+
 class ShapeDetector:
     """Detects question type by analyzing selection box shapes"""
 
     def __init__(self, config: Config):
         self.config = config
+        self._gray_buf = None  # Scratch buffers reused across ticks
+        self._blur_buf = None
+        self._edges_buf = None
+
+        if NUMBA_AVAILABLE:
+            # Trigger JIT compilation now instead of on the first question
+            _classify_contours(np.zeros(1), np.zeros(1),
+                               config.CIRCLE_MIN_CIRCULARITY, config.SQUARE_MAX_CIRCULARITY)
 
     def detect_question_type(self, answers_region_img: np.ndarray) -> Tuple[str, int]:
         """
@@ -191,28 +696,27 @@ class ShapeDetector:
         - 'single' for radio buttons (circles)
         - 'multi' for checkboxes (squares)
         """
-        gray = cv2.cvtColor(answers_region_img, cv2.COLOR_BGR2GRAY)
-        blurred = cv2.GaussianBlur(gray, (5, 5), 0)
-        edges = cv2.Canny(blurred, 50, 150)
-
-        contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        shape = answers_region_img.shape[:2]
+        self._gray_buf = reuse_buffer(self._gray_buf, shape)
+        self._blur_buf = reuse_buffer(self._blur_buf, shape)
+        self._edges_buf = reuse_buffer(self._edges_buf, shape)
 
-        circle_count = 0
-        square_count = 0
+        gray = cv2.cvtColor(answers_region_img, cv2.COLOR_BGR2GRAY, dst=self._gray_buf)
+        blurred = cv2.GaussianBlur(gray, (5, 5), 0, dst=self._blur_buf)
+        edges = cv2.Canny(blurred, 50, 150, edges=self._edges_buf)
 
-        for contour in contours:
-            area = cv2.contourArea(contour)
-            if 50 < area < 500:  # Reasonable size for selection boxes
-                perimeter = cv2.arcLength(contour, True)
-                if perimeter == 0:
-                    continue
+        contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
 
-                circularity = 4 * np.pi * area / (perimeter * perimeter)
+        areas = np.fromiter((cv2.contourArea(c) for c in contours),
+                            dtype=np.float64, count=len(contours))
+        perimeters = np.fromiter((cv2.arcLength(c, True) for c in contours),
+                                 dtype=np.float64, count=len(contours))
 
-                if circularity > self.config.CIRCLE_MIN_CIRCULARITY:
-                    circle_count += 1
-                elif circularity < self.config.SQUARE_MAX_CIRCULARITY:
-                    square_count += 1
+        circle_count, square_count = _classify_contours(
+            areas, perimeters,
+            self.config.CIRCLE_MIN_CIRCULARITY,
+            self.config.SQUARE_MAX_CIRCULARITY
+        )
 
         # Determine type based on dominant shape
         if circle_count > square_count:
@@ -224,45 +728,177 @@ class ShapeDetector:
             return 'unknown', 1
 
 
+# Detected answer blocks are stored as one structured array (field access: blocks['y'])
+BLOCK_DTYPE = np.dtype([('x', 'i4'), ('y', 'i4'), ('w', 'i4'), ('h', 'i4'), ('area', 'f4')])
+
+
 class AnswerBlockDetector:
     """Detects and locates answer blocks by color"""
 
+    _CLOSE_KERNEL = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
+
+    def __init__(self):
+        self._hsv_buf = None  # HSV frame reused across ticks
+        self._scratch = {}  # name -> mask buffer reused across ticks
+
+    def _scratch_buffer(self, name: str, shape: Tuple) -> np.ndarray:
+        """Per-name scratch mask (names are per color so passes can run concurrently)"""
+        buf = reuse_buffer(self._scratch.get(name), shape)
+        self._scratch[name] = buf
+        return buf
+
+    def to_hsv(self, img: np.ndarray) -> np.ndarray:
+        """Convert a BGR frame to HSV once so every color pass can share it"""
+        self._hsv_buf = reuse_buffer(self._hsv_buf, img.shape)
+        return cv2.cvtColor(img, cv2.COLOR_BGR2HSV, dst=self._hsv_buf)
+
+    def _color_mask(self, hsv: np.ndarray, color_name: str) -> np.ndarray:
+        """Closed binary mask of one block color (green/red) in an HSV frame"""
+        shape = hsv.shape[:2]
+        mask = self._scratch_buffer(color_name, shape)
+
+        if color_name == "green":
+            cv2.inRange(hsv, HSV_GREEN_LO, HSV_GREEN_HI, dst=mask)
+        else:  # red
+            mask1 = cv2.inRange(hsv, HSV_RED_LOW_LO, HSV_RED_LOW_HI, dst=mask)
+            mask2 = cv2.inRange(hsv, HSV_RED_HIGH_LO, HSV_RED_HIGH_HI,
+                                dst=self._scratch_buffer(color_name + "_hi", shape))
+            # Saturating OR in place (uint8 '+' wraps 255 + 255 to 254)
+            mask = cv2.bitwise_or(mask1, mask2, dst=mask1)
+
+        return cv2.morphologyEx(mask, cv2.MORPH_CLOSE, self._CLOSE_KERNEL,
+                                dst=self._scratch_buffer(color_name + "_closed", shape))
+
     @staticmethod
-    def detect_color_blocks(img: np.ndarray, color_name: str) -> List[Dict]:
+    def _blocks_from_stats(stats: np.ndarray, scale: float) -> np.ndarray:
+        """
+        Size-filter connectedComponentsWithStats rows (background already removed)
+        and return them as a BLOCK_DTYPE array in screen resolution, sorted by y
         """
-        Detect colored answer blocks (green/red)
-        Returns list of blocks with coordinates
+        min_area = 150 * scale * scale
+        min_w = 40 * scale
+        min_h = 10 * scale
+
+        keep = ((stats[:, cv2.CC_STAT_AREA] > min_area) &
+                (stats[:, cv2.CC_STAT_WIDTH] > min_w) &
+                (stats[:, cv2.CC_STAT_HEIGHT] > min_h))
+        stats = stats[keep]
+        # Sort by vertical position
+        stats = stats[np.argsort(stats[:, cv2.CC_STAT_TOP], kind='stable')]
+
+        blocks = np.empty(len(stats), dtype=BLOCK_DTYPE)
+        blocks['x'] = stats[:, cv2.CC_STAT_LEFT]
+        blocks['y'] = stats[:, cv2.CC_STAT_TOP]
+        blocks['w'] = stats[:, cv2.CC_STAT_WIDTH]
+        blocks['h'] = stats[:, cv2.CC_STAT_HEIGHT]
+        blocks['area'] = stats[:, cv2.CC_STAT_AREA]
+
+        if scale != 1.0:
+            for field in ('x', 'y', 'w', 'h'):
+                blocks[field] = np.round(blocks[field] / scale)
+            blocks['area'] /= scale * scale
+
+        return blocks
+
+    def detect_color_blocks(self, hsv: np.ndarray, color_name: str,
+                            scale: float = 1.0) -> np.ndarray:
+        """
+        Detect colored answer blocks (green/red) in an HSV frame from to_hsv()
+        scale: how much the frame was resized from screen resolution;
+        returned coordinates are always in screen resolution
+        Returns BLOCK_DTYPE array sorted by vertical position
         """
         try:
-            hsv = cv2.cvtColor(img, cv2.COLOR_BGR2HSV)
+            mask = self._color_mask(hsv, color_name)
 
-            if color_name == "green":
-                mask = cv2.inRange(hsv, np.array([25, 20, 20]), np.array([95, 255, 255]))
-            else:  # red
-                mask1 = cv2.inRange(hsv, np.array([0, 20, 20]), np.array([25, 255, 255]))
-                mask2 = cv2.inRange(hsv, np.array([155, 20, 20]), np.array([180, 255, 255]))
-                mask = mask1 + mask2
+            # Blocks are axis-aligned blobs: one labelling pass gives boxes and
+            # areas directly, no per-contour point lists
+            _, _, stats, _ = cv2.connectedComponentsWithStats(mask, connectivity=8)
+            return self._blocks_from_stats(stats[1:], scale)  # Row 0 is the background
 
-            kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
-            mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel)
+        except Exception as e:
+            print(f"Block detection error: {e}")
+            return np.empty(0, dtype=BLOCK_DTYPE)
 
-            contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    def detect_answer_blocks(self, hsv: np.ndarray,
+                             scale: float = 1.0) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Green and red blocks from a single labelling pass over the union of
+        both masks; each component takes the color covering most of its pixels
+        Returns (green_blocks, red_blocks) like detect_color_blocks()
+        """
+        try:
+            green = self._color_mask(hsv, "green")
+            red = self._color_mask(hsv, "red")
+            both = cv2.bitwise_or(green, red, dst=self._scratch_buffer("both", hsv.shape[:2]))
 
-            blocks = []
-            for contour in contours:
-                area = cv2.contourArea(contour)
-                if area > 150:
-                    x, y, w, h = cv2.boundingRect(contour)
-                    if w > 40 and h > 10:
-                        blocks.append({'x': x, 'y': y, 'w': w, 'h': h, 'area': area})
+            n, labels, stats, _ = cv2.connectedComponentsWithStats(both, connectivity=8)
+            green_px = np.bincount(labels[green > 0], minlength=n)
+            is_green = (green_px * 2 > stats[:, cv2.CC_STAT_AREA])[1:]
+            stats = stats[1:]  # Row 0 is the background
 
-            # Sort by vertical position
-            blocks.sort(key=lambda b: b['y'])
-            return blocks
+            return (self._blocks_from_stats(stats[is_green], scale),
+                    self._blocks_from_stats(stats[~is_green], scale))
 
         except Exception as e:
             print(f"Block detection error: {e}")
-            return []
+            empty = np.empty(0, dtype=BLOCK_DTYPE)
+            return empty, empty.copy()
+
+
+class ScreenCapture:
+    """
+    Primary-screen grabber: mss when available, pyautogui otherwise
+    mss handles are not thread-safe, so create one per capturing thread
+    """
+
+    def __init__(self):
+        self._sct = mss.mss() if MSS_AVAILABLE else None
+        self._region_bufs = {}  # region -> BGR buffer reused across grabs
+
+    def grab_region(self, region: Tuple[int, int, int, int], bgr: bool = True) -> np.ndarray:
+        """
+        Capture only (x1, y1, x2, y2) of the primary screen as a BGR array
+        The returned array is overwritten by the next grab of the same region;
+        copy what you keep
+        bgr=False: with mss, return the raw BGRA pixels as a zero-copy view
+        instead (for consumers that only need gray / channel 0, see to_gray)
+        """
+        x1, y1, x2, y2 = region
+        if self._sct is None:
+            screenshot = pyautogui.screenshot(region=(x1, y1, x2 - x1, y2 - y1))
+            return cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2BGR)
+
+        monitor = self._sct.monitors[1]
+        shot = self._sct.grab({
+            'left': monitor['left'] + x1,
+            'top': monitor['top'] + y1,
+            'width': x2 - x1,
+            'height': y2 - y1,
+        })
+        bgra = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+        if not bgr:
+            return bgra
+
+        # A bgra[:, :, :3] view would be copied by every OpenCV call anyway,
+        # so pack it once into the reused buffer
+        buf = reuse_buffer(self._region_bufs.get(region), (shot.height, shot.width, 3))
+        self._region_bufs[region] = buf
+        return cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR, dst=buf)
+
+    def close(self):
+        if self._sct is not None:
+            self._sct.close()
+            self._sct = None
+
+
+# =====================================================================
+# FUZZY MATCHING HELPERS
+# =====================================================================
+
+def normalize_text(text: str) -> str:
+    """Canonical form for fuzzy comparison (casefold + collapsed whitespace)"""
+    return ' '.join(text.casefold().split())
 
 
 # =====================================================================
@@ -270,7 +906,34 @@ class AnswerBlockDetector:
 # =====================================================================
 
 class AutoTestCorrector:
+    LOG_FLUSH_MS = 100  # Activity log is written to the widget at most this often
+    IMPORT_BATCH_SIZE = 10000  # Questions parsed per _import_questions call when streaming
+
+    # Question type + every answer of one question (LEFT JOIN keeps answerless questions)
+    _QUESTION_ANSWERS_SQL = """
+        SELECT q.question_type, q.required_answers, a.answer_text, a.is_correct
+        FROM questions q
+        LEFT JOIN answers a ON a.question_id = q.id
+        WHERE q.id = ?
+    """
+
+    # Write statements, always passed as these exact strings so the connection's
+    # statement cache (keyed by SQL text) prepares each one once per process
+    _INSERT_QUESTION_SQL = """
+        INSERT OR IGNORE INTO questions (question_text, question_type, required_answers)
+        VALUES (?, ?, ?)
+    """
+    _INSERT_ANSWER_SQL = """
+        INSERT INTO answers (question_id, answer_text, is_correct)
+        VALUES (?, ?, ?)
+    """
+    _INSERT_CORRECTION_SQL = """
+        INSERT INTO correction_log (question_text, wrong_answer, correct_answer, correction_successful)
+        VALUES (?, ?, ?, ?)
+    """
+
     def __init__(self, root):
+        load_gui()
         self.root = root
         self.root.title("Auto Test Corrector - Enhanced v2.0")
         self.root.geometry("1200x850")
@@ -294,7 +957,12 @@ class AutoTestCorrector:
         self.current_question_type = 'unknown'  # 'single' or 'multi'
         self.required_answers = 1
         self.answer_positions = []  # List of {text, x, y, region, is_correct}
-        self.last_screenshot = None
+        self._question_norms = {}  # question_id -> normalize_text(question_text)
+        self._question_by_norm = {}  # normalize_text(question_text) -> question_id
+        self._question_cache_ver = None  # (COUNT(*), MAX(id)) the caches were built from
+        self._answer_cache = {}  # question_id -> (correct, wrong, question_type, required, correct_norms)
+        # Fuzzy results per normalized text; cleared whenever the question cache reloads
+        self._fuzzy_match = functools.lru_cache(maxsize=1024)(self._fuzzy_match_uncached)
         self.auto_correcting = False  # Flag to prevent loop during correction
 
         # Statistics
@@ -302,59 +970,95 @@ class AutoTestCorrector:
         self.total_questions = 0
         self.correct_first_try = 0
         self.session_start_time = None
+        self._stats_pending = False  # An update_stats() callback is queued on Tk
 
         # Threading
         self.monitor_thread = None
+        self._consumer_thread = None  # process_frames() of the current (or last) run
+        self._frame_queue = None  # monitor_loop -> process_frames, one run at a time
+        self._reprocess_question = threading.Event()  # Consumer -> producer: retry last question
+        self._answers_gray_buf = None  # Grayscale answers region reused across scans
+        self._select_bufs = {}  # is_answer_selected scratch arrays (downscale/HSV/mask)
+        self._last_score_matrix = np.zeros((0, 0), dtype=np.float32)  # see _score_answers
+        self._click_event = threading.Event()  # Set by the mouse hook on answer-region clicks
+        self._mouse_listener = None
+        # Shape detection runs beside block detection (OpenCV releases the GIL)
+        self._detect_pool = ThreadPoolExecutor(max_workers=1)
+        # correction_log rows are written off the correction path, in batches
+        self._correction_queue = queue.Queue()
+        self._correction_writer = threading.Thread(target=self._correction_log_worker, daemon=True)
+        self._correction_writer.start()
         self.selection_window = None
         self.setup_step = 0
 
+        # Log lines queue up here from any thread and reach the widget in batches
+        self._log_queue = deque()
+
         # Create GUI
         self.create_gui()
+        self.root.after(self.LOG_FLUSH_MS, self._flush_log)
+
+        # Question cache first: imports use it to skip known questions without SQL
+        self.reload_question_cache()
 
         # Import existing data if available
-        self.import_existing_data()
+        if self.import_existing_data():
+            self.reload_question_cache()
         
     def init_database(self):
-        """Initialize SQLite database"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
-        
-        # Questions table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS questions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                question_text TEXT NOT NULL,
-                question_type TEXT DEFAULT 'single',
-                required_answers INTEGER DEFAULT 1,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Answers table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS answers (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                question_id INTEGER,
-                answer_text TEXT NOT NULL,
-                is_correct BOOLEAN,
-                FOREIGN KEY (question_id) REFERENCES questions(id)
-            )
-        """)
-        
-        # Correction log
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS correction_log (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                question_text TEXT,
-                wrong_answer TEXT,
-                correct_answer TEXT,
-                correction_successful BOOLEAN
-            )
-        """)
-        
-        conn.commit()
-        conn.close()
+        """Initialize SQLite database (one long-lived connection per thread, WAL mode)"""
+        # Each thread (GUI, monitor, correction writer) keeps its own autocommit
+        # connection, so WAL readers never wait on each other or on a writer;
+        # db_cursor() opens explicit transactions for writes
+        self._db_local = threading.local()
+        self._db_conns = []  # Every per-thread connection, for close()
+        self._db_conns_lock = threading.Lock()
+
+        with self.db_cursor(transaction=True) as cursor:
+            # Questions table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS questions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    question_text TEXT NOT NULL,
+                    question_type TEXT DEFAULT 'single',
+                    required_answers INTEGER DEFAULT 1,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+        
+            # Answers table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS answers (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    question_id INTEGER,
+                    answer_text TEXT NOT NULL,
+                    is_correct BOOLEAN,
+                    FOREIGN KEY (question_id) REFERENCES questions(id)
+                )
+            """)
+        
+            # Correction log
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS correction_log (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    question_text TEXT,
+                    wrong_answer TEXT,
+                    correct_answer TEXT,
+                    correction_successful BOOLEAN
+                )
+            """)
+
+            # Answer lookups are always by question
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_answers_qid ON answers(question_id)")
+            # Lets the correct/wrong answer counts come straight from the index
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_answers_correct ON answers(is_correct)")
+
+            # Question text lookups; UNIQUE unless an older DB already holds duplicates
+            try:
+                cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_questions_text ON questions(question_text)")
+            except sqlite3.IntegrityError:
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_questions_text_dup ON questions(question_text)")
         
     def create_gui(self):
         """Create main GUI"""
@@ -488,8 +1192,17 @@ OCR: Serbian (latinica) + English support"""
             
         log_message = f"[{timestamp}] {prefix} {message}\n"
         
-        self.log_display.insert(tk.END, log_message)
-        self.log_display.see(tk.END)
+        self._log_queue.append(log_message)
+
+    def _flush_log(self):
+        """Tk timer: write queued log lines with one insert/see, then re-arm"""
+        if self._log_queue:
+            lines = []
+            while self._log_queue:
+                lines.append(self._log_queue.popleft())
+            self.log_display.insert(tk.END, ''.join(lines))
+            self.log_display.see(tk.END)
+        self.root.after(self.LOG_FLUSH_MS, self._flush_log)
         
     def start_setup_wizard(self):
         """Start region setup wizard"""
@@ -501,7 +1214,9 @@ OCR: Serbian (latinica) + English support"""
         """Take screenshot and open selection"""
         try:
             screenshot = pyautogui.screenshot()
-            self.current_screenshot = cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2BGR)
+            # Only the size is needed (to map preview coords back to screen pixels);
+            # monitoring grabs its regions itself, so no full frame is kept around
+            self.current_screenshot_size = screenshot.size
             
             if self.setup_step == 1:
                 title = "STEP 1: Select Question Region"
@@ -529,9 +1244,12 @@ OCR: Serbian (latinica) + English support"""
         screen_width = self.selection_window.winfo_screenwidth()
         screen_height = self.selection_window.winfo_screenheight()
         
-        screenshot_resized = screenshot_pil.resize((screen_width, screen_height), 
-                                                   Image.Resampling.LANCZOS)
-        self.display_image = ImageTk.PhotoImage(screenshot_resized)
+        # Preview only: the grab is normally already screen-sized, otherwise a
+        # bilinear resize is plenty (LANCZOS is the most expensive resampler)
+        if screenshot_pil.size != (screen_width, screen_height):
+            screenshot_pil = screenshot_pil.resize((screen_width, screen_height),
+                                                   Image.Resampling.BILINEAR)
+        self.display_image = ImageTk.PhotoImage(screenshot_pil)
         
         canvas = tk.Canvas(self.selection_window, width=screen_width, 
                           height=screen_height, bg='black', highlightthickness=0)
@@ -583,8 +1301,7 @@ OCR: Serbian (latinica) + English support"""
                 bottom = max(y1, y2)
                 
                 # Scale coordinates
-                orig_width = self.current_screenshot.shape[1]
-                orig_height = self.current_screenshot.shape[0]
+                orig_width, orig_height = self.current_screenshot_size
                 scale_x = orig_width / screen_width
                 scale_y = orig_height / screen_height
                 
@@ -629,6 +1346,14 @@ OCR: Serbian (latinica) + English support"""
         if not self.question_region or not self.answers_region:
             messagebox.showerror("Setup Required", "Please setup regions first!")
             return
+
+        # The last run's threads may still be in OCR or an answer wait, and share the
+        # OCR handles and scratch buffers; start once they are gone (polled, not
+        # joined: they log through Tk, which would deadlock a blocked GUI thread)
+        if self._monitor_threads_alive():
+            self.start_button.config(state=tk.DISABLED)
+            self.root.after(100, self.start_monitoring)
+            return
             
         self.monitoring = True
         self.status_indicator.config(text="● MONITORING", foreground="green")
@@ -638,13 +1363,26 @@ OCR: Serbian (latinica) + English support"""
         
         self.log("Monitoring started! Take your test normally.", "SUCCESS")
         
+        # Mouse hook: wait_for_user_answer sleeps until a click instead of polling
+        if PYNPUT_AVAILABLE and self.config.CLICK_HOOK:
+            self._mouse_listener = mouse.Listener(on_click=self._on_click)
+            self._mouse_listener.start()
+
         # Start monitoring thread
         self.monitor_thread = threading.Thread(target=self.monitor_loop, daemon=True)
         self.monitor_thread.start()
         
+    def _monitor_threads_alive(self):
+        """Whether the producer or consumer of a monitoring run is still running"""
+        return any(thread is not None and thread.is_alive()
+                   for thread in (self.monitor_thread, self._consumer_thread))
+
     def stop_monitoring(self):
         """Stop monitoring"""
         self.monitoring = False
+        if self._mouse_listener is not None:
+            self._mouse_listener.stop()
+            self._mouse_listener = None
         self.status_indicator.config(text="● STOPPED", foreground="red")
         self.start_button.config(state=tk.NORMAL)
         self.stop_button.config(state=tk.DISABLED)
@@ -653,188 +1391,396 @@ OCR: Serbian (latinica) + English support"""
         self.log("Monitoring stopped.", "WARNING")
         
     def monitor_loop(self):
-        """Main monitoring loop (runs in background thread)"""
+        """
+        Main monitoring loop (runs in background thread)
+        Producer: grabs and hashes the question region; changed frames go, with
+        the answers region grabbed in the same tick, to a single-slot queue
+        drained by process_frames() on its own thread, so capture keeps running
+        (and stale frames get dropped) during OCR/waits
+        """
         last_question_hash = None
+        last_question_key = None
+        capture = ScreenCapture()
+        frame_queue = self._frame_queue = queue.Queue(maxsize=1)
+        self._reprocess_question.clear()
+
+        self._consumer_thread = threading.Thread(target=self.process_frames, args=(frame_queue,), daemon=True)
+        self._consumer_thread.start()
         
         while self.monitoring:
             try:
-                # Capture current question
-                screenshot = pyautogui.screenshot()
-                screenshot_cv = cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2BGR)
-                
-                x1, y1, x2, y2 = self.question_region
-                question_img = screenshot_cv[y1:y2, x1:x2]
+                # Consumer failed on the last frame: let the same question through again
+                if self._reprocess_question.is_set():
+                    self._reprocess_question.clear()
+                    last_question_hash = last_question_key = None
+
+                # Capture current question (only its region, not the full screen)
+                # (raw BGRA is enough: the question is only hashed and OCR'd in gray)
+                question_img = capture.grab_region(self.question_region, bgr=False)
+
+                # Identical pixels: nothing to do, skip even the perceptual hash
+                current_key = sample_key(question_img)
+                if current_key == last_question_key:
+                    time.sleep(self.config.MONITOR_INTERVAL)
+                    continue
+
+                # Perceptual hash to detect changes; skip the tick if nothing moved
+                current_hash = region_hash(question_img)
+                last_question_key = current_key
+
+                if (last_question_hash is not None and
+                        hash_distance(current_hash, last_question_hash) <= self.config.QUESTION_HASH_THRESHOLD):
+                    time.sleep(self.config.MONITOR_INTERVAL)
+                    continue
+
+                last_question_hash = current_hash
+
+                # The unanswered state is the click-detection baseline: take it now,
+                # before OCR, so a click made while the question is processed still
+                # shows up as a change (copied: the next grab reuses the buffer).
+                # Clicks before it are stale; later ones stay flagged until the wait
+                self._click_event.clear()
+                answers_img = capture.grab_region(self.answers_region).copy()
+                self._offer_frame(frame_queue, (question_img, answers_img))
                 
-                # Hash to detect changes
-                current_hash = hash(question_img.tobytes())
+                time.sleep(self.config.MONITOR_INTERVAL)
                 
-                if current_hash != last_question_hash:
-                    self.log("New question detected, processing...")
+            except Exception as e:
+                self.log(f"Monitor error: {e}", "ERROR")
+                time.sleep(1)
 
-                    # Extract and match question
-                    raw_question_text = self.ocr_text(question_img)
+        self._offer_frame(frame_queue, None)  # Stop the consumer
+        capture.close()
 
-                    if raw_question_text:
-                        # Clean question text using OCR processor
-                        self.current_question_text = OCRProcessor.clean_question_text(raw_question_text)
-                        matched_id = self.match_question(self.current_question_text)
-                        
-                        if matched_id:
-                            self.current_question_id = matched_id
-                            self.total_questions += 1
-                            self.update_stats()
-
-                            self.root.after(0, self.question_display.delete, 1.0, tk.END)
-                            self.root.after(0, self.question_display.insert, 1.0, self.current_question_text)
-                            
-                            self.log(f"Question matched (ID: {matched_id})", "SUCCESS")
-                            
-                            # Scan answer positions
-                            self.scan_answer_positions(screenshot_cv)
-                            
-                            # Wait for user click
-                            self.wait_for_user_answer(screenshot_cv)
-                        else:
-                            self.log("Question not in database!", "WARNING")
-                    
-                    last_question_hash = current_hash
-                    
-                time.sleep(0.5)
-                
+    @staticmethod
+    def _offer_frame(frame_queue, frame):
+        """Put into the single-slot queue, replacing a frame nobody picked up yet"""
+        while True:
+            try:
+                frame_queue.put_nowait(frame)
+                return
+            except queue.Full:
+                try:
+                    frame_queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def process_frames(self, frame_queue):
+        """Consumer thread: OCR, match, scan and wait on each new question frame"""
+        # Answers-region grabs of this run (a stopped run's consumer may still be
+        # finishing, so the handle is never shared through self)
+        capture = ScreenCapture()
+
+        while True:
+            frame = frame_queue.get()
+            if frame is None:
+                break
+
+            try:
+                self.process_question(*frame, capture)
             except Exception as e:
                 self.log(f"Monitor error: {e}", "ERROR")
+                self._reprocess_question.set()
                 time.sleep(1)
+
+        capture.close()
+        self._close_thread_db()  # A new consumer thread starts with each monitoring run
+
+    def process_question(self, question_img, answers_img, capture):
+        """
+        Handle one changed question frame (answers_img: grabbed in the same tick)
+        capture: the calling consumer thread's ScreenCapture
+        """
+        self.log("New question detected, processing...")
+
+        # Extract and match question
+        raw_question_text = self.ocr_text(question_img)
+
+        if raw_question_text:
+            # Clean question text using OCR processor
+            self.current_question_text = OCRProcessor.clean_question_text(raw_question_text)
+            matched_id = self.match_question(self.current_question_text)
+            
+            if matched_id:
+                self.current_question_id = matched_id
+                self.total_questions += 1
+
+                # Question text + stats in one Tk callback
+                self.root.after(0, self._apply_question_update,
+                                self.current_question_text, self._stats_snapshot())
+                
+                self.log(f"Question matched (ID: {matched_id})", "SUCCESS")
+
+                # Scan answer positions
+                self.scan_answer_positions(answers_img)
+                
+                # Wait for user click
+                self.wait_for_user_answer(answers_img, capture)
+            else:
+                self.log("Question not in database!", "WARNING")
                 
     def ocr_text(self, img):
         """Extract text from image using enhanced OCR processor"""
-        text, confidence = self.ocr_processor.extract_text(img)
+        text, confidence = self.ocr_processor.extract_text(to_gray(img))
         return text
             
+    def _db(self):
+        """This thread's connection, opened (and tuned) on first use"""
+        conn = getattr(self._db_local, "conn", None)
+        if conn is None:
+            # timeout: how long BEGIN IMMEDIATE waits for another thread's write
+            conn = sqlite3.connect(self.db_file, check_same_thread=False, isolation_level=None,
+                                   cached_statements=256, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA cache_size=-65536")  # 64 MB page cache (negative = KiB)
+            self._db_local.conn = conn
+            with self._db_conns_lock:
+                self._db_conns.append(conn)
+        return conn
+
+    def _close_thread_db(self):
+        """Close this thread's connection (end of a worker thread)"""
+        conn = getattr(self._db_local, "conn", None)
+        if conn is not None:
+            self._db_local.conn = None
+            with self._db_conns_lock:
+                if conn in self._db_conns:
+                    self._db_conns.remove(conn)
+            conn.close()
+
+    @contextlib.contextmanager
+    def db_cursor(self, transaction: bool = False):
+        """
+        Cursor on this thread's connection
+        transaction=True wraps the block in BEGIN IMMEDIATE/COMMIT (ROLLBACK on error);
+        IMMEDIATE takes the write lock up front instead of upgrading mid-transaction
+        """
+        cursor = self._db().cursor()
+        if not transaction:
+            yield cursor
+            return
+
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            yield cursor
+        except BaseException:
+            cursor.execute("ROLLBACK")
+            raise
+        cursor.execute("COMMIT")
+
+    def _question_table_version(self, cursor):
+        """Cheap change marker for the questions table"""
+        cursor.execute("SELECT COUNT(*), MAX(id) FROM questions")
+        return cursor.fetchone()
+
+    def reload_question_cache(self):
+        """Load normalized question texts once; call again after any DB import"""
+        with self.db_cursor() as cursor:
+            cursor.execute("SELECT id, question_text FROM questions")
+            self._question_norms = {qid: normalize_text(text) for qid, text in cursor.fetchall()}
+            self._question_cache_ver = self._question_table_version(cursor)
+
+        self._question_by_norm = {norm: qid for qid, norm in self._question_norms.items()}
+
+        self._answer_cache.clear()
+        self._fuzzy_match.cache_clear()
+
+    def _refresh_question_cache_if_stale(self):
+        """Reload the caches if another writer changed the questions table"""
+        with self.db_cursor() as cursor:
+            version = self._question_table_version(cursor)
+
+        if version != self._question_cache_ver:
+            self.reload_question_cache()
+
     def match_question(self, question_text):
         """Match question against database using fuzzy matching"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT id, question_text FROM questions")
-        questions = cursor.fetchall()
-        conn.close()
-        
-        best_match = None
-        best_score = 0
-        
-        for qid, db_question in questions:
-            score = fuzz.ratio(question_text.lower(), db_question.lower())
-            if score > best_score:
-                best_score = score
-                best_match = qid
-                
-        if best_score >= 85:  # 85% similarity threshold
-            return best_match
+        norm_question = normalize_text(question_text)
+
+        # Exact hit is a dict lookup; only fall back to fuzzy scan on a miss
+        qid = self._question_by_norm.get(norm_question)
+        if qid is not None:
+            return qid
+
+        # A miss may mean the DB grew since the cache was built
+        self._refresh_question_cache_if_stale()
+        qid = self._question_by_norm.get(norm_question)
+        if qid is not None:
+            return qid
+
+        return self._fuzzy_match(norm_question)
+
+    def _fuzzy_match_uncached(self, norm_question):
+        """Best fuzzy match for an already-normalized question (wrapped in an LRU cache)"""
+        match = process.extractOne(
+            norm_question,
+            self._question_norms,
+            scorer=fuzz.ratio,
+            processor=None,
+            score_cutoff=self.config.FUZZY_THRESHOLD
+        )
+
+        if match:
+            return match[2]  # (text, score, question_id)
         return None
-        
-    def scan_answer_positions(self, screenshot_cv):
+
+    def get_question_answers(self, question_id):
+        """
+        (correct, wrong, question_type, required_answers, correct_norms) for a question
+        Read from sqlite once per question; cleared with the question cache
+        correct_norms = normalize_text() of each correct answer, for _score_answers
+        """
+        cached = self._answer_cache.get(question_id)
+        if cached is not None:
+            return cached
+
+        # One round-trip for question type and all answers; the SQL text is a
+        # constant so sqlite3's per-connection statement cache reuses the parse
+        with self.db_cursor() as cursor:
+            cursor.execute(self._QUESTION_ANSWERS_SQL, (question_id,))
+            rows = cursor.fetchall()
+
+        db_correct_answers = []
+        db_wrong_answers = []
+        db_question_type = db_required = None
+        for db_question_type, db_required, answer_text, is_correct in rows:
+            if is_correct == 1:
+                db_correct_answers.append(answer_text)
+            elif is_correct == 0:
+                db_wrong_answers.append(answer_text)
+
+        cached = (db_correct_answers, db_wrong_answers, db_question_type, db_required,
+                  [normalize_text(a) for a in db_correct_answers])
+        self._answer_cache[question_id] = cached
+        return cached
+        
+    def scan_answer_positions(self, answers_img):
         """Scan and store answer block positions with enhanced detection"""
         x1, y1, x2, y2 = self.answers_region
-        answers_img = screenshot_cv[y1:y2, x1:x2]
 
-        # Detect question type by box shape
-        detected_type, _ = self.shape_detector.detect_question_type(answers_img)
+        # Detect question type by box shape (in parallel with block detection)
+        shape_future = self._detect_pool.submit(
+            self.shape_detector.detect_question_type, answers_img)
+
+        # Detect green and red blocks using enhanced detector
+        # Color blocks are large, so detect them on a downscaled copy;
+        # OCR crops still come from the full-resolution frame
+        scale = self.config.DETECT_SCALE
+        if scale != 1.0:
+            detect_img = cv2.resize(answers_img, None, fx=scale, fy=scale,
+                                    interpolation=cv2.INTER_AREA)
+        else:
+            detect_img = answers_img
+
+        # One HSV conversion and one labelling pass for both colors
+        hsv = self.block_detector.to_hsv(detect_img)
+        green_blocks, red_blocks = self.block_detector.detect_answer_blocks(hsv, scale)
+
+        detected_type, _ = shape_future.result()
         if detected_type != 'unknown':
             self.current_question_type = detected_type
             self.log(f"Question type detected: {detected_type.upper()}")
 
-        # Detect green and red blocks using enhanced detector
-        green_blocks = self.block_detector.detect_color_blocks(answers_img, "green")
-        red_blocks = self.block_detector.detect_color_blocks(answers_img, "red")
+        # Green blocks are correct answers, red blocks are wrong ones
+        blocks = [(b, True) for b in green_blocks] + [(b, False) for b in red_blocks]
+        # Gray once for the whole region; crops are then single-channel views
+        # (OCR only needs luminance, so no per-crop conversion or 3-channel hashing)
+        self._answers_gray_buf = reuse_buffer(self._answers_gray_buf, answers_img.shape[:2])
+        answers_gray = cv2.cvtColor(answers_img, cv2.COLOR_BGR2GRAY, dst=self._answers_gray_buf)
+        crops = [answers_gray[b['y']:b['y']+b['h'], b['x']:b['x']+b['w']] for b, _ in blocks]
+
+        # Cached crops skip Tesseract; the rest are OCR'd in parallel
+        answer_texts = self.ocr_processor.extract_text_batch(crops)
 
         self.answer_positions = []
 
-        # Process correct answers (green blocks)
-        for block in green_blocks:
-            bx, by, bw, bh = block['x'], block['y'], block['w'], block['h']
-            answer_region = answers_img[by:by+bh, bx:bx+bw]
-            answer_text = self.ocr_text(answer_region)
-
-            if answer_text:
-                # Clean the answer text
-                clean_text = OCRProcessor.clean_answer_text(answer_text)
-
-                # Store absolute screen coordinates
-                abs_x = x1 + bx + bw//2
-                abs_y = y1 + by + bh//2
-
-                self.answer_positions.append({
-                    'text': clean_text,
-                    'raw_text': answer_text,
-                    'x': abs_x,
-                    'y': abs_y,
-                    'region': (bx, by, bw, bh),
-                    'is_correct': True
-                })
-
-        # Process wrong answers (red blocks)
-        for block in red_blocks:
-            bx, by, bw, bh = block['x'], block['y'], block['w'], block['h']
-            answer_region = answers_img[by:by+bh, bx:bx+bw]
-            answer_text = self.ocr_text(answer_region)
-
-            if answer_text:
-                # Clean the answer text
-                clean_text = OCRProcessor.clean_answer_text(answer_text)
-
-                # Store absolute screen coordinates
-                abs_x = x1 + bx + bw//2
-                abs_y = y1 + by + bh//2
-
-                self.answer_positions.append({
-                    'text': clean_text,
-                    'raw_text': answer_text,
-                    'x': abs_x,
-                    'y': abs_y,
-                    'region': (bx, by, bw, bh),
-                    'is_correct': False
-                })
+        for (block, is_correct), answer_text in zip(blocks, answer_texts):
+            if not answer_text:
+                continue
+
+            bx, by, bw, bh = int(block['x']), int(block['y']), int(block['w']), int(block['h'])
+
+            # Clean the answer text
+            clean_text = OCRProcessor.clean_answer_text(answer_text)
+
+            # Store absolute screen coordinates
+            abs_x = x1 + bx + bw//2
+            abs_y = y1 + by + bh//2
+
+            self.answer_positions.append({
+                'text': clean_text,
+                'norm_text': normalize_text(clean_text),  # Compared by _score_answers
+                'raw_text': answer_text,
+                'x': abs_x,
+                'y': abs_y,
+                'region': (bx, by, bw, bh),
+                'is_correct': is_correct
+            })
 
         correct_count = sum(1 for a in self.answer_positions if a['is_correct'])
         wrong_count = len(self.answer_positions) - correct_count
 
         self.log(f"Found {len(self.answer_positions)} answers (✅{correct_count} ❌{wrong_count})")
             
-    def wait_for_user_answer(self, screenshot_before):
-        """Wait for user to click an answer and validate"""
+    def _on_click(self, x, y, button, pressed):
+        """Mouse hook callback (listener thread): flag presses inside the answers region"""
+        if not pressed or self.auto_correcting or not self.answers_region:
+            return
         x1, y1, x2, y2 = self.answers_region
+        if x1 <= x < x2 and y1 <= y < y2:
+            self._click_event.set()
+
+    def wait_for_user_answer(self, answers_before, capture):
+        """Wait for user to click an answer and validate"""
+        # answers_before is the producer's private copy; the grabs below reuse their buffer
+        before_region = answers_before
+        before_key = sample_key(before_region)
+        # Mean abs change is compared at quarter resolution (16x fewer pixels)
+        before_small = cv2.resize(before_region, None, fx=0.25, fy=0.25,
+                                  interpolation=cv2.INTER_AREA)
+        current_small = None
         
         # Wait for screen change in answers region
-        attempts = 0
-        max_attempts = 200  # 20 seconds max wait
-        
-        while self.monitoring and attempts < max_attempts:
+        deadline = time.monotonic() + 20  # 20 seconds max wait
+        poll_until = 0.0
+        
+        while self.monitoring and time.monotonic() < deadline:
+            if self._mouse_listener is not None and time.monotonic() >= poll_until:
+                # No captures until a click lands in the answers region
+                # (the timeout only makes stop_monitoring take effect)
+                if not self._click_event.wait(timeout=0.5):
+                    continue
+                self._click_event.clear()
+                # Poll for a moment after the click while the UI redraws
+                poll_until = time.monotonic() + 1.0
             time.sleep(0.1)
-            attempts += 1
             
             try:
-                current_screenshot = pyautogui.screenshot()
-                current_cv = cv2.cvtColor(np.array(current_screenshot), cv2.COLOR_RGB2BGR)
-                
-                before_region = screenshot_before[y1:y2, x1:x2]
-                current_region = current_cv[y1:y2, x1:x2]
+                current_region = capture.grab_region(self.answers_region)
+
+                # Unchanged sample hash: skip the full-region diff
+                if sample_key(current_region) == before_key:
+                    continue
                 
                 # Check if significant change occurred
-                diff = cv2.absdiff(before_region, current_region)
-                change = np.sum(diff) / diff.size
+                current_small = cv2.resize(current_region, before_small.shape[1::-1], dst=current_small,
+                                           interpolation=cv2.INTER_AREA)
+                change = cv2.norm(before_small, current_small, cv2.NORM_L1) / before_small.size
                 
-                if change > 5:  # Threshold for change detection
+                if change > self.config.CLICK_DETECT_THRESHOLD:
                     self.log("Answer click detected!")
                     
                     # Small delay for UI to settle
                     time.sleep(0.3)
                     
                     # Capture final state
-                    final_screenshot = pyautogui.screenshot()
-                    final_cv = cv2.cvtColor(np.array(final_screenshot), cv2.COLOR_RGB2BGR)
+                    final_region = capture.grab_region(self.answers_region)
                     
                     # Validate answer
-                    self.validate_and_correct(final_cv)
+                    self.validate_and_correct(final_region)
                     break
                     
             except:
@@ -843,7 +1789,7 @@ OCR: Serbian (latinica) + English support"""
 
     #ovo nekako radi ne diraj
     #MARK: Validation_C
-    def validate_and_correct(self, screenshot_cv):
+    def validate_and_correct(self, answers_img):
         """
         Enhanced validation and auto-correction system
         - Detects what user clicked
@@ -854,58 +1800,37 @@ OCR: Serbian (latinica) + English support"""
         if not self.current_question_id or self.auto_correcting:
             return
 
-        # Get correct and wrong answers from database
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT answer_text FROM answers
-            WHERE question_id = ? AND is_correct = 1
-        """, (self.current_question_id,))
-        db_correct_answers = [row[0] for row in cursor.fetchall()]
-
-        cursor.execute("""
-            SELECT answer_text FROM answers
-            WHERE question_id = ? AND is_correct = 0
-        """, (self.current_question_id,))
-        db_wrong_answers = [row[0] for row in cursor.fetchall()]
-
-        # Get question type from database
-        cursor.execute("""
-            SELECT question_type, required_answers FROM questions
-            WHERE id = ?
-        """, (self.current_question_id,))
-        result = cursor.fetchone()
-        if result:
-            db_question_type, db_required = result
-            if db_question_type:
-                self.current_question_type = db_question_type
-            if db_required:
-                self.required_answers = db_required
-
-        conn.close()
+        # Get correct and wrong answers from database (cached per question)
+        db_correct_answers, db_wrong_answers, db_question_type, db_required, db_correct_norms = \
+            self.get_question_answers(self.current_question_id)
+        if db_question_type:
+            self.current_question_type = db_question_type
+        if db_required:
+            self.required_answers = db_required
 
         # Detect which answers are currently selected
-        x1, y1, x2, y2 = self.answers_region
-        answers_img = screenshot_cv[y1:y2, x1:x2]
-
-        selected_answers = []
+        selected_idx = []
 
         # Check each answer position for selection indicators
-        for ans_pos in self.answer_positions:
+        for i, ans_pos in enumerate(self.answer_positions):
             bx, by, bw, bh = ans_pos['region']
             block_img = answers_img[by:by+bh, bx:bx+bw]
 
             if self.is_answer_selected(block_img):
-                selected_answers.append(ans_pos)
+                selected_idx.append(i)
 
-        if not selected_answers:
+        if not selected_idx:
             self.log("No selected answers detected", "WARNING")
             return
 
+        selected_answers = [self.answer_positions[i] for i in selected_idx]
+
+        # DB-correct x on-screen similarity, shared by validation and correction
+        self._last_score_matrix = self._score_answers(db_correct_norms)
+
         # Validate selections
         is_correct_selection = self._validate_answer_selection(
-            selected_answers,
+            selected_idx,
             db_correct_answers,
             db_wrong_answers
         )
@@ -923,36 +1848,45 @@ OCR: Serbian (latinica) + English support"""
                 db_correct_answers
             )
 
-    def _validate_answer_selection(self, selected_answers, db_correct_answers, db_wrong_answers):
+    def _score_answers(self, db_correct_norms):
+        """
+        fuzz.ratio of every DB-correct answer (rows) against every on-screen
+        answer position (columns), in one rapidfuzz cdist call
+        Both sides are pre-normalized (answer cache / scan_answer_positions)
+        """
+        positions = self.answer_positions
+        if not positions or not db_correct_norms:
+            return np.zeros((len(db_correct_norms), len(positions)), dtype=np.float32)
+
+        return process.cdist(
+            db_correct_norms,
+            [p['norm_text'] for p in positions],
+            scorer=fuzz.ratio,
+            processor=None
+        )
+
+    def _validate_answer_selection(self, selected_idx, db_correct_answers, db_wrong_answers):
         """
         Validate if user's selection is correct
+        selected_idx: indices into self.answer_positions
         Returns True if correct, False if wrong
         """
-        selected_texts = [ans['text'] for ans in selected_answers]
+        # Best score of each selected answer against any correct DB answer
+        scores = self._last_score_matrix
+        if scores.shape[0] == 0:
+            return False
+        is_match = scores[:, selected_idx].max(axis=0) >= self.config.FUZZY_THRESHOLD
 
         # For single answer questions
         if self.current_question_type == 'single':
-            if len(selected_texts) != 1:
-                return False
-
             # Check if the selected answer fuzzy-matches a correct answer
-            for correct in db_correct_answers:
-                if fuzz.ratio(selected_texts[0].lower(), correct.lower()) >= self.config.FUZZY_THRESHOLD:
-                    return True
-            return False
+            return len(selected_idx) == 1 and bool(is_match[0])
 
         # For multi-answer questions
         elif self.current_question_type == 'multi':
-            # Check if all selected answers are correct
-            matched_correct = 0
-            for selected in selected_texts:
-                for correct in db_correct_answers:
-                    if fuzz.ratio(selected.lower(), correct.lower()) >= self.config.FUZZY_THRESHOLD:
-                        matched_correct += 1
-                        break
-
             # All selected must be correct AND count must match required
-            return matched_correct == len(selected_texts) == self.required_answers
+            matched_correct = int(is_match.sum())
+            return matched_correct == len(selected_idx) == self.required_answers
 
         return False
 
@@ -968,19 +1902,15 @@ OCR: Serbian (latinica) + English support"""
             self.log(f"❌ Wrong selection: {', '.join(wrong_texts)}", "ERROR")
 
             # Find correct answer positions by fuzzy matching
+            # (score matrix computed once in validate_and_correct)
             correct_positions = []
-            for db_correct in db_correct_answers:
-                best_match = None
-                best_score = 0
-
-                for ans_pos in self.answer_positions:
-                    score = fuzz.ratio(ans_pos['text'].lower(), db_correct.lower())
-                    if score > best_score:
-                        best_score = score
-                        best_match = ans_pos
-
-                if best_match and best_score >= self.config.FUZZY_THRESHOLD:
-                    correct_positions.append(best_match)
+            positions = self.answer_positions
+            scores = self._last_score_matrix
+            if positions and db_correct_answers:
+                threshold = self.config.FUZZY_THRESHOLD
+                for row, col in enumerate(scores.argmax(axis=1)):
+                    if scores[row, col] >= threshold:
+                        correct_positions.append(positions[col])
 
             if not correct_positions:
                 self.log("Could not locate correct answers on screen!", "ERROR")
@@ -995,7 +1925,7 @@ OCR: Serbian (latinica) + English support"""
                 self.log(f"🔧 Auto-correcting to: {correct['text']}", "CORRECTION")     #da se promeni ovaj printf (ikonice su sranje/unsupported)
 
                 time.sleep(self.config.CORRECTION_DELAY)
-                pyautogui.click(correct['x'], correct['y'])
+                fast_click(correct['x'], correct['y'])
                 time.sleep(self.config.CORRECTION_DELAY)
 
                 self.correction_count += 1
@@ -1007,13 +1937,13 @@ OCR: Serbian (latinica) + English support"""
             elif self.current_question_type == 'multi':
                 # Unclick wrong selections
                 for wrong in wrong_selections:
-                    pyautogui.click(wrong['x'], wrong['y'])
+                    fast_click(wrong['x'], wrong['y'])
                     time.sleep(self.config.CORRECTION_DELAY)
 
                 # Click correct answers
                 correct_texts = []
                 for correct in correct_positions:
-                    pyautogui.click(correct['x'], correct['y'])
+                    fast_click(correct['x'], correct['y'])
                     time.sleep(self.config.CORRECTION_DELAY)
                     correct_texts.append(correct['text'])
 
@@ -1033,108 +1963,254 @@ OCR: Serbian (latinica) + English support"""
         # Simple heuristic: selected answers often have darker/different color
         # You may need to adjust this based on your test UI
         try:
-            hsv = cv2.cvtColor(block_img, cv2.COLOR_BGR2HSV)
-            
+            # Ratios survive a 2x area downscale; a quarter of the pixels to convert
+            h, w = block_img.shape[:2]
+            if h >= 8 and w >= 8:
+                block_img = cv2.resize(block_img, (w // 2, h // 2), interpolation=cv2.INTER_AREA,
+                                       dst=self._select_buffer("small", (h // 2, w // 2, 3)))
+
+            # One mask buffer serves every threshold below (each is counted right away)
+            mask = self._select_buffer("mask", block_img.shape[:2])
+            n_pixels = mask.size
+
+            # Early exit for plain white blocks (the common case): a pixel with every
+            # channel >= 206 has S < 50 and V > 100, so it can match neither mask.
+            # With fewer than 10% other pixels, neither ratio can reach its threshold
+            cv2.inRange(block_img, BGR_PLAIN_WHITE_LO, BGR_PLAIN_WHITE_HI, dst=mask)
+            if cv2.countNonZero(mask) > 0.9 * n_pixels:
+                return False
+
+            # Near-uniform block (solid fill): every pixel is about the mean color,
+            # so classifying that one color stands in for the whole HSV pass
+            mean, std = cv2.meanStdDev(block_img)
+            if float(std.max()) < self.config.SELECT_UNIFORM_STD:
+                pixel = np.clip(np.rint(mean), 0, 255).astype(np.uint8).reshape(1, 1, 3)
+                hsv_px = cv2.cvtColor(pixel, cv2.COLOR_BGR2HSV)
+                return bool(cv2.inRange(hsv_px, HSV_SELECTED_BLUE_LO, HSV_SELECTED_BLUE_HI)[0, 0] or
+                            cv2.inRange(hsv_px, HSV_SELECTED_DARK_LO, HSV_SELECTED_DARK_HI)[0, 0])
+
             # Check for blue/dark selection indicators
-            mask_blue = cv2.inRange(hsv, np.array([90, 50, 50]), np.array([130, 255, 255]))
-            mask_dark = cv2.inRange(hsv, np.array([0, 0, 0]), np.array([180, 255, 100]))
-            
-            blue_ratio = np.sum(mask_blue > 0) / mask_blue.size
-            dark_ratio = np.sum(mask_dark > 0) / mask_dark.size
+            if NUMBA_AVAILABLE:
+                # One compiled pass over the BGR pixels
+                n_blue, n_dark = _count_selection_pixels(block_img)
+            else:
+                hsv = cv2.cvtColor(block_img, cv2.COLOR_BGR2HSV,
+                                   dst=self._select_buffer("hsv", block_img.shape))
+                cv2.inRange(hsv, HSV_SELECTED_BLUE_LO, HSV_SELECTED_BLUE_HI, dst=mask)
+                n_blue = cv2.countNonZero(mask)
+                cv2.inRange(hsv, HSV_SELECTED_DARK_LO, HSV_SELECTED_DARK_HI, dst=mask)
+                n_dark = cv2.countNonZero(mask)
+
+            blue_ratio = n_blue / n_pixels
+            dark_ratio = n_dark / n_pixels
             
             return blue_ratio > 0.1 or dark_ratio > 0.3
         except:
             return False
             
+    def _select_buffer(self, name, shape):
+        """Scratch array for is_answer_selected, reused while block sizes repeat"""
+        buf = reuse_buffer(self._select_bufs.get(name), shape)
+        self._select_bufs[name] = buf
+        return buf
+
     def log_correction(self, wrong, correct, success):
-        """Log correction to database"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
+        """Log correction to database (queued; written by _correction_log_worker)"""
+        self._correction_queue.put((self.current_question_text, wrong, correct, success))
+
+    def _correction_log_worker(self):
+        """Background writer: drains queued corrections into one transaction each"""
+        while True:
+            row = self._correction_queue.get()
+            if row is None:
+                return
 
-        cursor.execute("""
-            INSERT INTO correction_log (question_text, wrong_answer, correct_answer, correction_successful)
-            VALUES (?, ?, ?, ?)
-        """, (self.current_question_text, wrong, correct, success))
+            rows = [row]
+            stop = False
+            while True:
+                try:
+                    row = self._correction_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if row is None:
+                    stop = True
+                    break
+                rows.append(row)
+
+            try:
+                with self.db_cursor(transaction=True) as cursor:
+                    cursor.executemany(self._INSERT_CORRECTION_SQL, rows)
+            except sqlite3.Error as e:
+                self.log(f"Correction log error: {e}", "ERROR")
 
-        conn.commit()
-        conn.close()
+            if stop:
+                return
+
+    def close(self):
+        """Flush pending correction_log rows and release the DB connection"""
+        self.monitoring = False
+
+        # Let the monitoring threads finish before the OCR handles and DB
+        # connections they use are released
+        if self.monitor_thread is not None:
+            self.monitor_thread.join(timeout=5)
+        if self._frame_queue is not None:
+            self._offer_frame(self._frame_queue, None)  # Stop the consumer
+        if self._consumer_thread is not None:
+            self._consumer_thread.join(timeout=5)
+
+        self._correction_queue.put(None)
+        self._correction_writer.join(timeout=5)
+        self._detect_pool.shutdown(wait=False)
+        self.ocr_processor.close()
+        with self._db_conns_lock:
+            for conn in self._db_conns:
+                conn.close()
+            self._db_conns.clear()
     
     #this is problematic, fix latter TODO:11 MARK: 11
     def update_stats(self):
-        """Update statistics display"""
-        self.root.after(0, self.total_q_label.config, {'text': str(self.total_questions)})
-        self.root.after(0, self.correct_label.config, {'text': str(self.correct_first_try)})
-        self.root.after(0, self.corrected_label.config, {'text': str(self.correction_count)})
-        
-        if self.total_questions > 0:
-            success_rate = (self.correct_first_try / self.total_questions) * 100
-            self.root.after(0, self.current_q_label.config, 
-                          {'text': f"Q{self.total_questions} ({success_rate:.1f}% accuracy)"})
-        
+        """Update statistics display (one Tk callback for all labels)"""
+        # Coalesce bursts: while one update is pending, later calls ride along
+        # (the pending callback reads the counters when it runs)
+        if self._stats_pending:
+            return
+        self._stats_pending = True
+        self.root.after_idle(self._apply_pending_stats)
+
+    def _apply_pending_stats(self):
+        """Runs on the Tk thread: latest counters for a coalesced update_stats()"""
+        self._stats_pending = False
+        self._apply_stats(*self._stats_snapshot())
+
+    def _stats_snapshot(self):
+        """Counters as of now, for a later Tk-thread update"""
+        return self.total_questions, self.correct_first_try, self.correction_count
+
+    def _apply_stats(self, total, correct, corrected):
+        """Runs on the Tk thread: write all stat labels"""
+        self.total_q_label.config(text=str(total))
+        self.correct_label.config(text=str(correct))
+        self.corrected_label.config(text=str(corrected))
+        
+        if total > 0:
+            success_rate = (correct / total) * 100
+            self.current_q_label.config(text=f"Q{total} ({success_rate:.1f}% accuracy)")
+
+    def _apply_question_update(self, question_text, stats):
+        """Runs on the Tk thread: show a newly matched question and its stats"""
+        self.question_display.delete(1.0, tk.END)
+        self.question_display.insert(1.0, question_text)
+        self._apply_stats(*stats)
+        
+    def _import_questions(self, cursor, questions, seen=None):
+        """
+        Insert questions that are not in the DB yet, plus their answers
+        Runs on a db_cursor(transaction=True) cursor; returns number imported
+        Known questions are skipped against the in-memory question cache (the
+        same normalized form match_question looks up), so no existence SQL;
+        INSERT OR IGNORE on the UNIQUE text index catches anything it missed
+        seen: normalized texts from earlier batches of the same import
+        """
+        if seen is None:
+            seen = set()
+
+        new_questions = []
+        for q in questions:
+            # Skip questions already in the DB (or repeated in this import)
+            question_text = q.get("question", "")
+            if not question_text:
+                continue
+            norm = normalize_text(question_text)
+            if norm in self._question_by_norm or norm in seen:
+                continue
+            seen.add(norm)
+            new_questions.append(q)
+
+        if not new_questions:
+            return 0
+
+        # Rows inserted now get ids above the current maximum (we hold the write lock)
+        cursor.execute("SELECT COALESCE(MAX(id), 0) FROM questions")
+        max_id = cursor.fetchone()[0]
+
+        cursor.executemany(
+            self._INSERT_QUESTION_SQL,
+            [(q["question"], q.get("question_type", "single"), q.get("required_correct_answers", 1))
+             for q in new_questions]
+        )
+
+        # Only the rows that were actually inserted come back here
+        cursor.execute("SELECT question_text, id FROM questions WHERE id > ?", (max_id,))
+        new_ids = dict(cursor.fetchall())
+
+        answer_rows = []
+        for q in new_questions:
+            question_id = new_ids.get(q["question"])
+            if question_id is None:
+                continue
+            answer_rows.extend((question_id, ans, 1) for ans in q.get("correct_answers", []))
+            answer_rows.extend((question_id, ans, 0) for ans in q.get("wrong_answers", []))
+
+        # All answers in one executemany
+        cursor.executemany(self._INSERT_ANSWER_SQL, answer_rows)
+
+        return len(new_ids)
+
+    def _import_json_file(self, json_file):
+        """
+        Import {"questions": [...]} from a file; returns number imported (None if no key)
+        With ijson the file is streamed in IMPORT_BATCH_SIZE batches, so memory
+        stays flat however large qa_data.json gets
+        """
+        if not IJSON_AVAILABLE:
+            with open(json_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if "questions" not in data:
+                return None
+            with self.db_cursor(transaction=True) as cursor:
+                return self._import_questions(cursor, data["questions"])
+
+        imported = 0
+        streamed = 0
+        seen = set()
+        with open(json_file, "rb") as f:
+            items = ijson.items(f, "questions.item", use_float=True)
+            with self.db_cursor(transaction=True) as cursor:
+                while True:
+                    batch = list(itertools.islice(items, self.IMPORT_BATCH_SIZE))
+                    if not batch:
+                        break
+                    streamed += len(batch)
+                    imported += self._import_questions(cursor, batch, seen)
+
+            # No items: an empty "questions" list, or no such key at all (None, as above)
+            if not streamed:
+                f.seek(0)
+                if not any(prefix == "" and event == "map_key" and value == "questions"
+                           for prefix, event, value in ijson.parse(f)):
+                    return None
+        return imported
+
     #MARK: Import data
     def import_existing_data(self):
-        """Import data from existing qa_data.json if it exists"""
+        """Import data from existing qa_data.json if it exists; returns number imported"""
         json_file = "qa_data.json"
         
         if os.path.exists(json_file):
             try:
-                with open(json_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    
-                if "questions" in data:
-                    conn = sqlite3.connect(self.db_file)
-                    cursor = conn.cursor()
-                    
-                    imported = 0
-                    
-                    for q in data["questions"]:
-                        # Check if question already exists
-                        question_text = q.get("question", "")
-                        if not question_text:
-                            continue
-                            
-                        cursor.execute("SELECT id FROM questions WHERE question_text = ?", 
-                                     (question_text,))
-                        existing = cursor.fetchone()
-                        
-                        if not existing:
-                            # Insert question
-                            qtype = q.get("question_type", "single")
-                            required = q.get("required_correct_answers", 1)
-                            
-                            cursor.execute("""
-                                INSERT INTO questions (question_text, question_type, required_answers)
-                                VALUES (?, ?, ?)
-                            """, (question_text, qtype, required))
-                            
-                            question_id = cursor.lastrowid
-                            
-                            # Insert correct answers
-                            for ans in q.get("correct_answers", []):
-                                cursor.execute("""
-                                    INSERT INTO answers (question_id, answer_text, is_correct)
-                                    VALUES (?, ?, 1)
-                                """, (question_id, ans))
-                                
-                            # Insert wrong answers
-                            for ans in q.get("wrong_answers", []):
-                                cursor.execute("""
-                                    INSERT INTO answers (question_id, answer_text, is_correct)
-                                    VALUES (?, ?, 0)
-                                """, (question_id, ans))
-                                
-                            imported += 1
-                            
-                    conn.commit()
-                    conn.close()
+                imported = self._import_json_file(json_file)
                     
+                if imported is not None:
                     if imported > 0:
                         self.log(f"Imported {imported} questions from qa_data.json", "SUCCESS")
                     else:
                         self.log("All questions already in database", "INFO")
+                    return imported
                         
             except Exception as e:
                 self.log(f"Error importing data: {e}", "ERROR")
+        return 0
     
     #rewieve with DB TODO:21 MARK: 21
     def import_data_dialog(self):
@@ -1155,46 +2231,10 @@ OCR: Serbian (latinica) + English support"""
                 data = json.loads(json_text)
                 
                 if "questions" in data:
-                    conn = sqlite3.connect(self.db_file)
-                    cursor = conn.cursor()
-                    
-                    imported = 0
-                    
-                    for q in data["questions"]:
-                        question_text = q.get("question", "")
-                        if not question_text:
-                            continue
-                            
-                        cursor.execute("SELECT id FROM questions WHERE question_text = ?", 
-                                     (question_text,))
-                        if not cursor.fetchone():
-                            qtype = q.get("question_type", "single")
-                            required = q.get("required_correct_answers", 1)
-                            
-                            cursor.execute("""
-                                INSERT INTO questions (question_text, question_type, required_answers)
-                                VALUES (?, ?, ?)
-                            """, (question_text, qtype, required))
-                            
-                            question_id = cursor.lastrowid
-                            
-                            for ans in q.get("correct_answers", []):
-                                cursor.execute("""
-                                    INSERT INTO answers (question_id, answer_text, is_correct)
-                                    VALUES (?, ?, 1)
-                                """, (question_id, ans))
-                                
-                            for ans in q.get("wrong_answers", []):
-                                cursor.execute("""
-                                    INSERT INTO answers (question_id, answer_text, is_correct)
-                                    VALUES (?, ?, 0)
-                                """, (question_id, ans))
-                                
-                            imported += 1
-                            
-                    conn.commit()
-                    conn.close()
+                    with self.db_cursor(transaction=True) as cursor:
+                        imported = self._import_questions(cursor, data["questions"])
                     
+                    self.reload_question_cache()
                     messagebox.showinfo("Success", f"Imported {imported} new questions!")
                     dialog.destroy()
                 else:
@@ -1210,28 +2250,18 @@ OCR: Serbian (latinica) + English support"""
     #test with real DB
     def show_database_stats(self):
         """Show database statistics"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT COUNT(*) FROM questions")
-        total_questions = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM answers WHERE is_correct = 1")
-        total_correct = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM answers WHERE is_correct = 0")
-        total_wrong = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM correction_log")
-        total_corrections = cursor.fetchone()[0]
-        
-        cursor.execute("""
-            SELECT COUNT(*) FROM correction_log 
-            WHERE correction_successful = 1
-        """)
-        successful_corrections = cursor.fetchone()[0]
-        
-        conn.close()
+        # All counters in one statement; one pass per table
+        with self.db_cursor() as cursor:
+            cursor.execute("""
+                SELECT
+                    (SELECT COUNT(*) FROM questions),
+                    (SELECT COUNT(*) FROM answers WHERE is_correct = 1),
+                    (SELECT COUNT(*) FROM answers WHERE is_correct = 0),
+                    (SELECT COUNT(*) FROM correction_log),
+                    (SELECT COUNT(*) FROM correction_log WHERE correction_successful = 1)
+            """)
+            (total_questions, total_correct, total_wrong,
+             total_corrections, successful_corrections) = cursor.fetchone()
         
         stats_text = f"""📊 DATABASE STATISTICS
 
@@ -1247,6 +2277,7 @@ Successful Corrections: {successful_corrections}
 
 
 def main():
+    load_gui()
     root = tk.Tk()
     app = AutoTestCorrector(root)
     
@@ -1254,6 +2285,8 @@ def main():
         root.mainloop()
     except KeyboardInterrupt:
         pass
+    finally:
+        app.close()
 
 
 if __name__ == "__main__":
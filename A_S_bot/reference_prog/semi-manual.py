@@ -10,6 +10,12 @@ Features:
 - Success notifications without interrupting flow
 """
 
+import os
+
+# Single-threaded Tesseract (tesserocr and tesseract.exe both inherit this): OpenMP
+# start-up per recognize call costs more than it saves on question/answer-sized regions
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
 import cv2
@@ -18,13 +24,123 @@ import pytesseract
 from PIL import Image, ImageTk, ImageEnhance
 import pyautogui
 import json
-import os
+import tempfile
 from datetime import datetime
 import threading
-import keyboard
+import concurrent.futures
+import collections
 import time
 import re
 
+# Optional global hotkeys (system-wide hook; may need admin rights on Windows)
+try:
+    import keyboard
+    KEYBOARD_AVAILABLE = True
+except ImportError:
+    KEYBOARD_AVAILABLE = False
+
+# Optional fast screen capture (BitBlt straight into a buffer)
+try:
+    import mss
+    MSS_AVAILABLE = True
+except ImportError:
+    MSS_AVAILABLE = False
+
+# Optional in-process Tesseract API (avoids one tesseract.exe spawn per OCR call)
+try:
+    from tesserocr import PyTessBaseAPI, PSM, OEM, RIL, iterate_level
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+# Optional JIT for the fused answer-color mask
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+# Optional fast JSON for the Q&A data files (same indented layout as json.dump)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# What a failed OCR call raises: tesseract exit status, missing tesseract binary (OSError),
+# tesserocr (RuntimeError) and cv2 on a degenerate crop
+OCR_ERRORS = (pytesseract.TesseractError, OSError, RuntimeError, cv2.error)
+
+# Answer block HSV ranges (OpenCV 8-bit HSV; red wraps around the hue axis), built once as
+# uint8 arrays shared by the cv2.inRange path and the numba kernel
+HSV_GREEN_LO, HSV_GREEN_HI = np.array([25, 20, 20], np.uint8), np.array([95, 255, 255], np.uint8)
+HSV_RED_LO1, HSV_RED_HI1 = np.array([0, 20, 20], np.uint8), np.array([25, 255, 255], np.uint8)
+HSV_RED_LO2, HSV_RED_HI2 = np.array([155, 20, 20], np.uint8), np.array([180, 255, 255], np.uint8)
+BLOCK_CLOSE_KERNEL = cv2.getStructuringElement(cv2.MORPH_RECT, (2, 2))  # Closes gaps in the color masks
+
+
+# OpenCV's 8-bit fixed-point division tables: round((255 << 12) / v), round((180 << 12) / (6 * diff))
+_SAT_DIV = np.array([0] + [int(np.rint((255 << 12) / v)) for v in range(1, 256)], dtype=np.int32)
+_HUE_DIV = np.array([0] + [int(np.rint((180 << 12) / (6.0 * d))) for d in range(1, 256)], dtype=np.int32)
+
+
+def _in_hsv_range(h, s, v, lo, hi):
+    return lo[0] <= h <= hi[0] and lo[1] <= s <= hi[1] and lo[2] <= v <= hi[2]
+
+
+def _answer_color_masks(img, green, red):
+    """
+    Green and red answer masks of a BGR image in one pass, no HSV frame
+    Same tests as the HSV_GREEN_* / HSV_RED_* inRange calls, using OpenCV's 8-bit
+    fixed-point H/S formulas so the masks match cvtColor exactly
+    Only used compiled (numba); the cv2 path in fast_color_blocks_both is the fallback
+    """
+    for i in prange(img.shape[0]):
+        for j in range(img.shape[1]):
+            b = np.int32(img[i, j, 0])
+            g = np.int32(img[i, j, 1])
+            r = np.int32(img[i, j, 2])
+            v = max(b, g, r)
+
+            # S = round(255 * diff / V), H = round(30 * sector offset / diff) (12-bit fixed point)
+            diff = v - min(b, g, r)
+            sat = 0
+            h = 0
+            if diff != 0:
+                sat = (diff * _SAT_DIV[v] + (1 << 11)) >> 12
+                if v == r:
+                    h = g - b
+                elif v == g:
+                    h = b - r + 2 * diff
+                else:
+                    h = r - g + 4 * diff
+                h = (h * _HUE_DIV[diff] + (1 << 11)) >> 12
+                if h < 0:
+                    h += 180
+
+            green[i, j] = 255 if _in_hsv_range(h, sat, v, HSV_GREEN_LO, HSV_GREEN_HI) else 0
+            red[i, j] = 255 if (_in_hsv_range(h, sat, v, HSV_RED_LO1, HSV_RED_HI1) or
+                                _in_hsv_range(h, sat, v, HSV_RED_LO2, HSV_RED_HI2)) else 0
+
+
+if NUMBA_AVAILABLE:
+    _in_hsv_range = njit(inline='always')(_in_hsv_range)
+    _answer_color_masks = njit(parallel=True, cache=True)(_answer_color_masks)
+
+
+def json_loads(text):
+    """Parse JSON text with orjson when available"""
+    return orjson.loads(text) if ORJSON_AVAILABLE else json.loads(text)
+
+
+def json_dumps(obj, indent=False):
+    """Serialize to a JSON str keeping non-ASCII text; indent=True matches json.dumps(indent=2)"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None)
+
 class UltimateAutomatedQAExtractor:
     def __init__(self, root):
         self.root = root
@@ -35,10 +151,31 @@ class UltimateAutomatedQAExtractor:
         self.tesseract_path = r"C:\dt\Tesseract-OCR\tesseract.exe"
         pytesseract.pytesseract.tesseract_cmd = self.tesseract_path
 
+        # OCR / CV runs on one worker thread (keeps Tk responsive; also serializes
+        # the Tesseract handle, which is not thread-safe)
+        self.ocr_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+        # Per-block tesseract.exe runs (no tesserocr) are separate processes and can overlap
+        self.block_pool = concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+
+        # Persistent Tesseract handle, loaded on the OCR thread so the window
+        # comes up without waiting for the language models (OCR jobs queue behind it)
+        self.api = None
+        if TESSEROCR_AVAILABLE:
+            self.ocr_executor.submit(self.init_ocr)
+
         # Data storage
         self.json_file = "qa_data.json"
+        self.jsonl_file = "qa_data.jsonl"  # Append-only log, folded into json_file on stop / exit
+        self.jsonl_handle = None
+        self.recent_questions = collections.deque(maxlen=5)  # Records shown in the data display
+        self.detect_bufs = {}  # Block detection scratch arrays (downscale/HSV/masks/labels)
         self.current_screenshot = None
-        self.selection_window = None
+        self.screenshot_to_bgr = cv2.COLOR_RGB2BGR  # Color conversion for crops of current_screenshot
+        self.sct = mss.mss() if MSS_AVAILABLE else None
+        self.selection_window = None  # Created once, hidden between selections
+        self.selection_open = False
+        self.selection_mode = "question"
         self.is_active = False
         self.question_counter = 1
         self.processing = False
@@ -55,6 +192,10 @@ class UltimateAutomatedQAExtractor:
         self.required_correct_answers = 0
         self.phase = "idle"
 
+        # Screen geometry is fixed for the session: read it once
+        self.screen_size = (self.root.winfo_screenwidth(), self.root.winfo_screenheight())
+        self.scale_x = self.scale_y = 1.0  # Screenshot pixels per overlay pixel
+
         # Create GUI
         self.create_gui()
 
@@ -243,7 +384,7 @@ Hotkeys: SPACE = Next question, ESC = Cancel current, 🛑 Stop = End session"""
             self.loading_label.config(text=message)
             self.spinner.start(8)
             self.root.update_idletasks()
-        except:
+        except tk.TclError:
             pass
 
     def stop_spinner(self, speed_message=""):
@@ -256,14 +397,14 @@ Hotkeys: SPACE = Next question, ESC = Cancel current, 🛑 Stop = End session"""
                 self.speed_label.config(text=speed_message)
                 self.root.after(3000, lambda: self.safe_clear_speed())
             self.root.update_idletasks()
-        except:
+        except tk.TclError:
             pass
 
     def safe_clear_speed(self):
         """Clear speed label"""
         try:
             self.speed_label.config(text="")
-        except:
+        except tk.TclError:
             pass
 
     def show_success(self, message):
@@ -271,7 +412,7 @@ Hotkeys: SPACE = Next question, ESC = Cancel current, 🛑 Stop = End session"""
         try:
             self.success_label.config(text=message)
             self.root.after(2500, lambda: self.success_label.config(text=""))
-        except:
+        except tk.TclError:
             pass
 
     def setup_keyboard_listener(self):
@@ -282,19 +423,30 @@ Hotkeys: SPACE = Next question, ESC = Cancel current, 🛑 Stop = End session"""
                     self.start_new_question_in_continuous()
 
         def on_escape_press():
-            if self.selection_window:
-                self.selection_window.destroy()
-                self.selection_window = None
+            if self.selection_open:
+                self.hide_selection_window()
                 self.redo_mode = None
             elif self.continuous_mode:
                 # ESC cancels current but stays in continuous mode
                 self.reset_current_question()
 
-        try:
-            keyboard.add_hotkey('space', on_space_press)
-            keyboard.add_hotkey('esc', on_escape_press)
-        except Exception as e:
-            print(f"Hotkey setup error: {e}")
+        # Global hotkeys fire on the hook thread; hand them to the Tk thread
+        if KEYBOARD_AVAILABLE:
+            try:
+                keyboard.add_hotkey('space', lambda: self.root.after(0, on_space_press))
+                keyboard.add_hotkey('esc', lambda: self.root.after(0, on_escape_press))
+                return
+            except Exception as e:
+                print(f"Hotkey setup error: {e}")
+
+        # Fallback: Tk bindings (no hook thread, no admin; work while the app has focus)
+        def on_space_key(event):
+            if event.widget.winfo_class() in ('Text', 'Entry', 'TEntry'):
+                return  # Let space type normally in the preview boxes
+            on_space_press()
+
+        self.root.bind_all('<KeyPress-space>', on_space_key)
+        self.root.bind_all('<Escape>', lambda e: on_escape_press())
 
     def start_continuous_mode(self):
         """Start continuous processing mode"""
@@ -322,6 +474,9 @@ Hotkeys: SPACE = Next question, ESC = Cancel current, 🛑 Stop = End session"""
 
         self.stop_spinner()
 
+        # Fold this session's appended records into the JSON file
+        self.compact_saved_questions()
+
         # Update UI
         self.start_button.config(state=tk.NORMAL)
         self.stop_button.config(state=tk.DISABLED)
@@ -332,9 +487,7 @@ Hotkeys: SPACE = Next question, ESC = Cancel current, 🛑 Stop = End session"""
         self.phase_label.config(text="Ready", foreground="blue")
         self.update_status("Continuous mode stopped. Click 'Start Continuous Mode' to begin.")
 
-        if self.selection_window:
-            self.selection_window.destroy()
-            self.selection_window = None
+        self.hide_selection_window()
 
     def start_new_question_in_continuous(self):
         """Start new question in continuous mode"""
@@ -374,7 +527,7 @@ Hotkeys: SPACE = Next question, ESC = Cancel current, 🛑 Stop = End session"""
         try:
             self.status_label.config(text=message)
             self.root.update_idletasks()
-        except:
+        except tk.TclError:
             pass
 
     def redo_question_selection(self):
@@ -395,12 +548,28 @@ Hotkeys: SPACE = Next question, ESC = Cancel current, 🛑 Stop = End session"""
         else:
             messagebox.showwarning("Not Active", "Please start continuous mode first.")
 
+    def grab_screen(self):
+        """
+        Capture the screen; returns the PIL image for the selection overlay
+        self.current_screenshot is a view of the captured pixels (no copy, no
+        full-frame color conversion); only the selected crop becomes BGR later
+        """
+        if self.sct is not None:
+            # mss: raw BGRA straight from the primary monitor
+            raw = self.sct.grab(self.sct.monitors[1])
+            self.current_screenshot = np.frombuffer(raw.bgra, dtype=np.uint8).reshape(raw.height, raw.width, 4)
+            self.screenshot_to_bgr = cv2.COLOR_BGRA2BGR
+            return Image.frombytes("RGB", raw.size, raw.rgb)
+
+        screenshot = pyautogui.screenshot()
+        self.current_screenshot = np.asarray(screenshot)
+        self.screenshot_to_bgr = cv2.COLOR_RGB2BGR
+        return screenshot
+
     def take_screenshot_and_select(self):
         """Fast screenshot"""
         try:
-            screenshot = pyautogui.screenshot()
-            self.current_screenshot = cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2BGR)
-            self.open_selection_window(screenshot)
+            self.open_selection_window(self.grab_screen())
         except Exception as e:
             messagebox.showerror("Error", f"Screenshot failed: {e}")
 
@@ -408,18 +577,46 @@ Hotkeys: SPACE = Next question, ESC = Cancel current, 🛑 Stop = End session"""
         """Auto-open answers selection"""
         if not self.redo_mode and self.continuous_mode:
             try:
-                screenshot = pyautogui.screenshot()
-                self.current_screenshot = cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2BGR)
-                self.open_selection_window(screenshot)
+                self.open_selection_window(self.grab_screen())
             except Exception as e:
                 self.update_status(f"Error: {e}")
 
+    def create_selection_window(self):
+        """Create the fullscreen selection window once; later selections only swap its contents"""
+        self.selection_window = tk.Toplevel(self.root)
+        self.selection_window.attributes('-topmost', True)
+        self.selection_window.attributes('-fullscreen', True)
+        self.selection_window.configure(bg='black')
+        self.selection_window.protocol("WM_DELETE_WINDOW", self.cancel_selection)
+
+        screen_width, screen_height = self.screen_size
+
+        canvas = tk.Canvas(self.selection_window, width=screen_width, height=screen_height, bg='black')
+        canvas.pack()
+
+        # One screen-sized overlay image for the window's lifetime, overwritten in place by paste()
+        self.display_image = ImageTk.PhotoImage("RGB", (screen_width, screen_height))
+
+        self.selection_canvas = canvas
+        self.selection_image_item = canvas.create_image(0, 0, anchor=tk.NW, image=self.display_image)
+
+        # Instructions (text and color set per selection)
+        self.instruction_item = canvas.create_text(screen_width//2, 30, fill='red', font=('Arial', 18, 'bold'))
+        self.subtitle_item = canvas.create_text(screen_width//2, 60, fill='yellow', font=('Arial', 12))
+        canvas.create_text(screen_width//2, 85, text="Drag & Release | ESC = Cancel", fill='white', font=('Arial', 10))
+
+        self.setup_selection_events(canvas)
+
+    def hide_selection_window(self):
+        """Hide the selection window (kept for the next selection)"""
+        if self.selection_open:
+            self.selection_window.withdraw()
+            self.selection_open = False
+
     def open_selection_window(self, screenshot_pil):
         """Open selection window with proper mode handling"""
-        if self.selection_window:
-            self.selection_window.destroy()
-
-        self.selection_window = tk.Toplevel(self.root)
+        if self.selection_window is None:
+            self.create_selection_window()
 
         # Determine selection mode
         if self.redo_mode == "question":
@@ -435,21 +632,21 @@ Hotkeys: SPACE = Next question, ESC = Cancel current, 🛑 Stop = End session"""
             title = "Step 2: Select Answers"
             current_mode = "answers"
 
+        self.selection_mode = current_mode
         self.selection_window.title(title)
-        self.selection_window.attributes('-topmost', True)
-        self.selection_window.attributes('-fullscreen', True)
-        self.selection_window.configure(bg='black')
-
-        screen_width = self.selection_window.winfo_screenwidth()
-        screen_height = self.selection_window.winfo_screenheight()
 
-        screenshot_resized = screenshot_pil.resize((screen_width, screen_height), Image.Resampling.LANCZOS)
-        self.display_image = ImageTk.PhotoImage(screenshot_resized)
+        # Preview only needs to be drawn on: skip the resize when sizes match, else cheap bilinear
+        if screenshot_pil.size == self.screen_size:
+            screenshot_resized = screenshot_pil
+        else:
+            screenshot_resized = screenshot_pil.resize(self.screen_size, Image.Resampling.BILINEAR)
 
-        canvas = tk.Canvas(self.selection_window, width=screen_width, height=screen_height, bg='black')
-        canvas.pack()
+        # Overlay → screenshot coordinate scale, fixed until the next capture
+        self.scale_x = screenshot_pil.size[0] / self.screen_size[0]
+        self.scale_y = screenshot_pil.size[1] / self.screen_size[1]
+        self.display_image.paste(screenshot_resized)
 
-        canvas.create_image(0, 0, anchor=tk.NW, image=self.display_image)
+        canvas = self.selection_canvas
 
         # Instructions
         if current_mode == "question":
@@ -469,14 +666,21 @@ Hotkeys: SPACE = Next question, ESC = Cancel current, 🛑 Stop = End session"""
                 subtitle = "AUTO-SAVES after processing!"
             color = 'green'
 
-        canvas.create_text(screen_width//2, 30, text=instruction, fill=color, font=('Arial', 18, 'bold'))
-        canvas.create_text(screen_width//2, 60, text=subtitle, fill='yellow', font=('Arial', 12))
-        canvas.create_text(screen_width//2, 85, text="Drag & Release | ESC = Cancel", fill='white', font=('Arial', 10))
+        canvas.itemconfig(self.instruction_item, text=instruction, fill=color)
+        canvas.itemconfig(self.subtitle_item, text=subtitle)
+
+        # Clear the previous selection
+        self.selection_start = None
+        if self.selection_rect:
+            canvas.delete(self.selection_rect)
+            self.selection_rect = None
 
-        self.setup_selection_events(canvas, screen_width, screen_height, current_mode)
+        self.selection_window.deiconify()
+        self.selection_open = True
+        self.selection_window.focus_set()
 
-    def setup_selection_events(self, canvas, screen_width, screen_height, current_mode):
-        """Setup selection events"""
+    def setup_selection_events(self, canvas):
+        """Setup selection events (bound once; the mode is read from self.selection_mode)"""
         self.selection_start = None
         self.selection_rect = None
 
@@ -493,7 +697,7 @@ Hotkeys: SPACE = Next question, ESC = Cancel current, 🛑 Stop = End session"""
                 x1, y1 = self.selection_start
                 x2, y2 = event.x, event.y
 
-                color = 'red' if current_mode == "question" else 'green'
+                color = 'red' if self.selection_mode == "question" else 'green'
                 self.selection_rect = canvas.create_rectangle(x1, y1, x2, y2, outline=color, width=3)
 
         def on_mouse_up(event):
@@ -501,6 +705,7 @@ Hotkeys: SPACE = Next question, ESC = Cancel current, 🛑 Stop = End session"""
             if self.selection_start:
                 x1, y1 = self.selection_start
                 x2, y2 = event.x, event.y
+                self.selection_start = None
 
                 left = min(x1, x2)
                 top = min(y1, y2)
@@ -508,56 +713,49 @@ Hotkeys: SPACE = Next question, ESC = Cancel current, 🛑 Stop = End session"""
                 bottom = max(y1, y2)
 
                 # Scale coordinates
-                orig_width, orig_height = self.current_screenshot.shape[1], self.current_screenshot.shape[0]
-                scale_x = orig_width / screen_width
-                scale_y = orig_height / screen_height
-
                 self.selection_coords = (
-                    int(left * scale_x), int(top * scale_y),
-                    int(right * scale_x), int(bottom * scale_y)
+                    int(left * self.scale_x), int(top * self.scale_y),
+                    int(right * self.scale_x), int(bottom * self.scale_y)
                 )
 
-                self.process_selected_region(current_mode)
+                self.process_selected_region(self.selection_mode)
 
         canvas.bind('<Button-1>', on_mouse_down)
         canvas.bind('<B1-Motion>', on_mouse_drag)
         canvas.bind('<ButtonRelease-1>', on_mouse_up)
         canvas.bind('<Escape>', lambda e: self.cancel_selection())
-        self.selection_window.focus_set()
 
     def cancel_selection(self):
         """Cancel selection"""
-        if self.selection_window:
-            self.selection_window.destroy()
-            self.selection_window = None
+        self.hide_selection_window()
         self.redo_mode = None
 
     def process_selected_region(self, current_mode):
         """Process region based on mode"""
         try:
-            if self.selection_window:
-                self.selection_window.destroy()
-                self.selection_window = None
+            self.hide_selection_window()
 
             left, top, right, bottom = self.selection_coords
             selected_region = self.current_screenshot[top:bottom, left:right]
+            self.current_screenshot = None  # Only the crop is needed; every selection captures anew
 
             if selected_region.size == 0:
                 return
 
-            # Process based on what was selected
+            # OCR / color detection work in BGR; convert just the selection
+            selected_region = cv2.cvtColor(selected_region, self.screenshot_to_bgr)
+
+            # Process based on what was selected (OCR runs in the background;
+            # results are applied on the Tk thread when ready)
             if current_mode == "question":
-                self.process_question_fast(selected_region)
+                self.process_question_fast(selected_region, self.redo_mode)
                 # Auto-advance to answers (unless redo)
                 if not self.redo_mode and self.continuous_mode:
                     self.phase = "answers"
                     self.phase_label.config(text="STEP 2: SELECT ANSWERS", foreground="green")
                     self.root.after(400, self.auto_open_answers_selection)
             else:  # answers
-                self.process_answers_fast(selected_region)
-                # AUTO-SAVE after answers (unless redo)
-                if not self.redo_mode and self.continuous_mode:
-                    self.auto_save_and_continue()
+                self.process_answers_fast(selected_region, self.redo_mode)
 
             # Clear redo mode
             self.redo_mode = None
@@ -573,20 +771,34 @@ Hotkeys: SPACE = Next question, ESC = Cancel current, 🛑 Stop = End session"""
             # Auto-save without user intervention
             self.save_qa_set_silent()
 
-    def process_question_fast(self, region_cv):
+    def run_in_background(self, work, region_cv, on_done, *args):
+        """Run work(region_cv) on the OCR thread, then on_done(future, *args) on the Tk thread"""
+        future = self.ocr_executor.submit(work, region_cv)
+        future.add_done_callback(lambda f: self.root.after(0, on_done, f, *args))
+
+    def process_question_fast(self, region_cv, redo):
         """Fast question processing with enhanced bubble cleaning"""
-        start_time = time.time()
         self.start_spinner("Processing question...")
+        self.run_in_background(self.question_worker, region_cv, self.apply_question_result, time.time(), redo)
+
+    def question_worker(self, region_cv):
+        """OCR + cleaning for the question (worker thread, no Tk calls)"""
+        raw_text, confidence = self.fast_ocr(region_cv)
+        return raw_text, self.clean_question_enhanced(raw_text)
+
+    def apply_question_result(self, future, start_time, redo):
+        """Show the question result (Tk thread)"""
+        if not self.continuous_mode:
+            return
 
         try:
-            # Fast OCR
-            raw_text, confidence = self.fast_ocr(region_cv)
+            raw_text, question = future.result()
 
             # Quick type detection
             self.detect_question_type(raw_text)
 
             # Enhanced question cleaning
-            self.current_question = self.clean_question_enhanced(raw_text)
+            self.current_question = question
             self.question_text.delete(1.0, tk.END)
             self.question_text.insert(1.0, self.current_question)
 
@@ -594,7 +806,7 @@ Hotkeys: SPACE = Next question, ESC = Cancel current, 🛑 Stop = End session"""
             speed_time = time.time() - start_time
             self.stop_spinner(f"⚡ {speed_time:.1f}s")
 
-            if self.redo_mode:
+            if redo:
                 self.update_status(f"Question re-read! Type: {self.question_type.title()}")
             else:
                 self.update_status(f"{self.question_type.title()} question ready. Auto-opening answers...")
@@ -603,44 +815,62 @@ Hotkeys: SPACE = Next question, ESC = Cancel current, 🛑 Stop = End session"""
             self.stop_spinner()
             self.update_status(f"Question error: {e}")
 
-    def process_answers_fast(self, region_cv):
+    def process_answers_fast(self, region_cv, redo):
         """Fast answer processing with enhanced cleaning"""
-        start_time = time.time()
         self.start_spinner("Processing answers...")
+        self.run_in_background(self.answers_worker, region_cv, self.apply_answers_result, time.time(), redo)
+
+    def answers_worker(self, region_cv):
+        """Block detection + OCR + cleaning for the answers (worker thread, no Tk calls)"""
+        # Fast block detection (one HSV pass for both colors)
+        green_blocks, red_blocks = self.fast_color_blocks_both(region_cv)
+
+        if len(green_blocks) + len(red_blocks) < 3:
+            return len(green_blocks), len(red_blocks), None, None
+
+        # One OCR pass for all blocks, then split back into green / red
+        # (grayscale once for the whole region; block crops are views into it)
+        region_gray = cv2.cvtColor(region_cv, cv2.COLOR_BGR2GRAY)
+        block_texts = self.batch_text_from_blocks(region_gray, green_blocks + red_blocks)
+
+        # Enhanced text extraction with better bubble cleaning
+        correct_answers = []
+        for text, conf in block_texts[:len(green_blocks)]:
+            if text:
+                clean_text = self.clean_answer_enhanced(text)
+                if clean_text and len(clean_text) > 2:
+                    correct_answers.append({'text': clean_text, 'confidence': conf})
+
+        wrong_answers = []
+        for text, conf in block_texts[len(green_blocks):]:
+            if text:
+                clean_text = self.clean_answer_enhanced(text)
+                if clean_text and len(clean_text) > 2:
+                    wrong_answers.append({'text': clean_text, 'confidence': conf})
+
+        return len(green_blocks), len(red_blocks), correct_answers, wrong_answers
+
+    def apply_answers_result(self, future, start_time, redo):
+        """Show the answers result and auto-save (Tk thread)"""
+        if not self.continuous_mode:
+            return
 
         try:
-            # Fast block detection
-            green_blocks = self.fast_color_blocks(region_cv, "green")
-            red_blocks = self.fast_color_blocks(region_cv, "red")
+            green_count, red_count, correct_answers, wrong_answers = future.result()
+            total_blocks = green_count + red_count
 
-            total_blocks = len(green_blocks) + len(red_blocks)
-
-            if total_blocks < 3:
+            if correct_answers is None:
                 self.stop_spinner()
                 messagebox.showwarning("Few Blocks", f"Only {total_blocks} blocks found.")
                 return
 
             # Update counts
-            self.green_count_label.config(text=f"✅{len(green_blocks)}")
-            self.red_count_label.config(text=f"❌{len(red_blocks)}")
+            self.green_count_label.config(text=f"✅{green_count}")
+            self.red_count_label.config(text=f"❌{red_count}")
             self.total_count_label.config(text=f"📊{total_blocks}")
 
-            # Enhanced text extraction with better bubble cleaning
-            self.correct_answers = []
-            for block in green_blocks:
-                text, conf = self.fast_text_from_block(region_cv, block)
-                if text:
-                    clean_text = self.clean_answer_enhanced(text)
-                    if clean_text and len(clean_text) > 2:
-                        self.correct_answers.append({'text': clean_text, 'confidence': conf})
-
-            self.wrong_answers = []
-            for block in red_blocks:
-                text, conf = self.fast_text_from_block(region_cv, block)
-                if text:
-                    clean_text = self.clean_answer_enhanced(text)
-                    if clean_text and len(clean_text) > 2:
-                        self.wrong_answers.append({'text': clean_text, 'confidence': conf})
+            self.correct_answers = correct_answers
+            self.wrong_answers = wrong_answers
 
             # Show speed
             speed_time = time.time() - start_time
@@ -650,79 +880,90 @@ Hotkeys: SPACE = Next question, ESC = Cancel current, 🛑 Stop = End session"""
             self.update_answers_fast()
 
             total = len(self.correct_answers) + len(self.wrong_answers)
-            if self.redo_mode:
+            if redo:
                 self.update_status(f"Answers re-read! Found {total} clean answers.")
             else:
                 self.update_status(f"Found {total} answers! Auto-saving...")
+                # AUTO-SAVE after answers (unless redo)
+                self.auto_save_and_continue()
 
         except Exception as e:
             self.stop_spinner()
             self.update_status(f"Answers error: {e}")
 
+    # Comprehensive bubble patterns, compiled once (tried in order by clean_answer_enhanced)
+    BUBBLE_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+        # Single answer bubbles (round)
+        r'^[0oOоО]+\s*',
+        r'^[ФфΦφ]+\s*',
+        r'^[○◯●⚫⚪]+\s*',
+
+        # Multi-answer bubbles (rectangular)
+        r'^[MМм]+\s*',
+        r'^[MМм][IiІі]+\s*',
+        r'^[БбBb]+\s*',
+        r'^[БбBb][IiІі]+\s*',
+        r'^[ИиIi]+\s*',
+        r'^[ПпPp]+\s*',
+        r'^[НнHhNn]+\s*',
+
+        # Combined patterns
+        r'^[0oOоОФфΦφ○◯●⚫⚪MМмBbБбИиIiПпPpНнHhNn]+[IiІі]*\s*',
+
+        # With punctuation
+        r'^[\[\(]?[0oOоОФфΦφ○◯●⚫⚪MМмBbБбИиIiПпPpНнHhNn]+[IiІі]*[\]\)]?\s*',
+
+        # Multiple characters (OCR errors)
+        r'^[0oOоОФфΦφ○◯●⚫⚪MМмBbБбИиIiПпPpНнHhNn]{2,}\s*',
+    ))
+    # Every bubble pattern starts with one of these characters (same IGNORECASE class)
+    BUBBLE_START_RE = re.compile(r'[\[\(0oOоОФфΦφ○◯●⚫⚪MМмBbБбИиIiПпPpНнHhNn]', re.IGNORECASE)
+    SINGLE_BUBBLE_RE = re.compile(r'^[0oOоОФфΦφMМмBbБбИиIi]\s+')
+    LEADING_PUNCT_RE = re.compile(r'^[.,-]+\s*')
+    WHITESPACE_RE = re.compile(r'\s+')
+    # "Broj potrebnih odgovora: N" line: N gives the type, the whole match is cut from the question
+    BROJ_RE = re.compile(r"Broj potrebnih odgovora:\s*(\d+)", re.IGNORECASE)
+    QUESTION_BUBBLE_RE = re.compile(r'^[0oOоОФфΦφMМмBbБб]+\s*')
+
     def clean_answer_enhanced(self, text):
         """Enhanced answer cleaning - removes ALL bubble variations"""
         try:
             original = text.strip()
 
-            # Comprehensive bubble patterns
-            bubble_patterns = [
-                # Single answer bubbles (round)
-                r'^[0oOоО]+\s*',
-                r'^[ФфΦφ]+\s*',
-                r'^[○◯●⚫⚪]+\s*',
-
-                # Multi-answer bubbles (rectangular)
-                r'^[MМм]+\s*',
-                r'^[MМм][IiІі]+\s*',
-                r'^[БбBb]+\s*',
-                r'^[БбBb][IiІі]+\s*',
-                r'^[ИиIi]+\s*',
-                r'^[ПпPp]+\s*',
-                r'^[НнHhNn]+\s*',
-
-                # Combined patterns
-                r'^[0oOоОФфΦφ○◯●⚫⚪MМмBbБбИиIiПпPpНнHhNn]+[IiІі]*\s*',
-
-                # With punctuation
-                r'^[\[\(]?[0oOоОФфΦφ○◯●⚫⚪MМмBbБбИиIiПпPpНнHhNn]+[IiІі]*[\]\)]?\s*',
-
-                # Multiple characters (OCR errors)
-                r'^[0oOоОФфΦφ○◯●⚫⚪MМмBbБбИиIiПпPpНнHhNn]{2,}\s*',
-            ]
-
             cleaned = original
 
-            # Try each pattern
-            for pattern in bubble_patterns:
-                new_cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-                if new_cleaned != cleaned and len(new_cleaned.strip()) > 2:
-                    cleaned = new_cleaned.strip()
-                    break
+            # Try each pattern (most OCR lines have no leading bubble; skip them all then)
+            if self.BUBBLE_START_RE.match(cleaned):
+                for pattern in self.BUBBLE_PATTERNS:
+                    new_cleaned = pattern.sub('', cleaned)
+                    if new_cleaned != cleaned and len(new_cleaned.strip()) > 2:
+                        cleaned = new_cleaned.strip()
+                        break
 
             # Additional cleanup
             if cleaned:
                 # Remove remaining single bubble chars at start
-                cleaned = re.sub(r'^[0oOоОФфΦφMМмBbБбИиIi]\s+', '', cleaned)
+                cleaned = self.SINGLE_BUBBLE_RE.sub('', cleaned)
 
                 # Remove leading punctuation
-                cleaned = re.sub(r'^[.,-]+\s*', '', cleaned)
+                cleaned = self.LEADING_PUNCT_RE.sub('', cleaned)
 
                 # Normalize whitespace
-                cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+                cleaned = self.WHITESPACE_RE.sub(' ', cleaned).strip()
 
             if cleaned != original:
                 print(f"Enhanced cleaning: '{original[:30]}' → '{cleaned[:30]}'")
 
             return cleaned if cleaned and len(cleaned) > 2 else original
 
-        except:
+        except (AttributeError, TypeError):
             return text.strip()
 
     def clean_question_enhanced(self, text):
         """Enhanced question cleaning"""
         try:
             # Remove indicator line
-            cleaned = re.sub(r"Broj potrebnih odgovora:\s*\d+", "", text, flags=re.IGNORECASE)
+            cleaned = self.BROJ_RE.sub("", text)
 
             # Remove bubble chars from start of lines
             lines = []
@@ -730,74 +971,276 @@ Hotkeys: SPACE = Next question, ESC = Cancel current, 🛑 Stop = End session"""
                 line = line.strip()
                 if line:
                     # Remove bubble chars from start
-                    line = re.sub(r'^[0oOоОФфΦφMМмBbБб]+\s*', '', line)
+                    line = self.QUESTION_BUBBLE_RE.sub('', line)
                     if len(line) > 3:
                         lines.append(line)
 
             result = ' '.join(lines)
             return result if result else text
 
-        except:
+        except (AttributeError, TypeError):
             return text
 
+    OCR_TARGET_CHAR_HEIGHT = 30  # Tesseract reads best with characters about this tall (px)
+    OCR_MAX_UPSCALE = 2.0
+
+    def prepare_ocr_image(self, region_cv):
+        """
+        Grayscale, upscale and Otsu binarization used before every OCR call (BGR or gray input)
+        Text that is already tall enough is binarized at native size; otherwise (or when the
+        text height can't be measured) it is upscaled, up to 2x
+        """
+        gray = region_cv if region_cv.ndim == 2 else cv2.cvtColor(region_cv, cv2.COLOR_BGR2GRAY)
+        _, processed = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+
+        char_height = self.median_char_height(processed)
+        if char_height:
+            scale = min(self.OCR_MAX_UPSCALE, self.OCR_TARGET_CHAR_HEIGHT / char_height)
+        else:
+            scale = self.OCR_MAX_UPSCALE
+
+        if scale > 1.05:
+            gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_LINEAR)
+            _, processed = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        return processed
+
+    def median_char_height(self, binary):
+        """Median height of character-sized ink components in a binarized image, or 0 if unknown"""
+        # Ink is the minority color (dark text on light blocks, or the reverse)
+        if cv2.countNonZero(binary) * 2 > binary.size:
+            binary = cv2.bitwise_not(binary)
+
+        _, _, stats, _ = cv2.connectedComponentsWithStats(binary, connectivity=8)
+        heights = stats[1:, cv2.CC_STAT_HEIGHT]
+        widths = stats[1:, cv2.CC_STAT_WIDTH]
+        chars = heights[(heights >= 4) & (heights < binary.shape[0] * 0.8) & (widths < binary.shape[1] * 0.5)]
+        return float(np.median(chars)) if chars.size >= 3 else 0
+
     def fast_ocr(self, region_cv):
-        """Fast OCR"""
+        """Fast OCR (single attempt: a failing region returns no text instead of a second Tesseract run)"""
         try:
-            gray = cv2.cvtColor(region_cv, cv2.COLOR_BGR2GRAY)
-            gray = cv2.resize(gray, None, fx=2, fy=2, interpolation=cv2.INTER_LINEAR)
-            _, processed = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+            processed = self.prepare_ocr_image(region_cv)
 
-            text = pytesseract.image_to_string(processed, lang="srp+eng", config="--oem 1 --psm 6").strip()
+            if self.api is not None:
+                self.set_api_image(self.api, processed)
+                text = self.api.GetUTF8Text().strip()
+            else:
+                text = pytesseract.image_to_string(processed, lang="srp+eng", config="--oem 1 --psm 6").strip()
             return text, 75
-        except:
-            try:
-                text = pytesseract.image_to_string(region_cv, lang="eng", config="--psm 6").strip()
-                return text, 60
-            except:
-                return "", 0
+        except OCR_ERRORS:
+            return "", 0
 
-    def fast_color_blocks(self, region_cv, color_name):
-        """Fast color detection"""
+    def set_api_image(self, api, image):
+        """Hand a uint8 gray/RGB array to Tesseract as raw bytes (no PIL round trip)"""
+        image = np.ascontiguousarray(image)
+        height, width = image.shape[:2]
+        bytes_per_pixel = 1 if image.ndim == 2 else image.shape[2]
+        api.SetImageBytes(image.tobytes(), width, height, bytes_per_pixel, width * bytes_per_pixel)
+
+    def init_ocr(self):
+        """
+        Create the persistent Tesseract handle (Serbian + English), loaded once
+        instead of per OCR call; LSTM-only and single-threaded on purpose, since
+        every region OCR'd here is small
+        """
+        tessdata = os.path.join(os.path.dirname(self.tesseract_path), "tessdata")
         try:
-            hsv = cv2.cvtColor(region_cv, cv2.COLOR_BGR2HSV)
-
-            if color_name == "green":
-                mask = cv2.inRange(hsv, np.array([25, 20, 20]), np.array([95, 255, 255]))
+            self.api = PyTessBaseAPI(path=tessdata, lang="srp+eng",
+                                     oem=OEM.LSTM_ONLY, psm=PSM.SINGLE_BLOCK)
+        except RuntimeError as e:
+            print(f"tesserocr init failed, using pytesseract: {e}")
+            self.close_ocr()
+
+    def close_ocr(self):
+        """Release the persistent Tesseract handle"""
+        if self.api is not None:
+            self.api.End()
+        self.api = None
+
+    BLOCK_MIN_AREA = 120  # Even lower for better detection
+
+    DETECT_SCALE = 2  # Blocks are detected on a 1/DETECT_SCALE downscaled copy of the region
+
+    def fast_color_blocks_both(self, region_cv):
+        """
+        Fast color detection: returns (green_blocks, red_blocks) from a single HSV pass
+        Detection runs at reduced resolution; boxes come back in full-resolution coordinates
+        """
+        try:
+            height, width = region_cv.shape[:2]
+            small_size = (max(1, round(width / self.DETECT_SCALE)), max(1, round(height / self.DETECT_SCALE)))
+            small_shape = (small_size[1], small_size[0])
+
+            # fx/fy (not dsize) keeps OpenCV's exact-ratio area path; dst only supplies the memory
+            small = cv2.resize(region_cv, None, dst=self.detect_buffer('small', small_shape + (3,)),
+                               fx=1 / self.DETECT_SCALE, fy=1 / self.DETECT_SCALE, interpolation=cv2.INTER_AREA)
+            mask_green = self.detect_buffer('green', small_shape)
+            mask_red = self.detect_buffer('red', small_shape)
+
+            if NUMBA_AVAILABLE:
+                # One fused pass: BGR in, both masks out
+                _answer_color_masks(small, mask_green, mask_red)
             else:
-                mask1 = cv2.inRange(hsv, np.array([0, 20, 20]), np.array([25, 255, 255]))
-                mask2 = cv2.inRange(hsv, np.array([155, 20, 20]), np.array([180, 255, 255]))
-                mask = mask1 + mask2
-
-            kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (2, 2))
-            mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel)
-
-            contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-
-            blocks = []
-            for contour in contours:
-                area = cv2.contourArea(contour)
-                if area > 120:  # Even lower for better detection
-                    x, y, w, h = cv2.boundingRect(contour)
-                    if w > 35 and h > 5:
-                        blocks.append({'x': x, 'y': y, 'w': w, 'h': h})
-
-            blocks.sort(key=lambda b: b['y'])
-            return blocks
-        except:
-            return []
-
-    def fast_text_from_block(self, region_cv, block):
-        """Fast text extraction"""
+                hsv = cv2.cvtColor(small, cv2.COLOR_BGR2HSV, dst=self.detect_buffer('hsv', small_shape + (3,)))
+
+                cv2.inRange(hsv, HSV_GREEN_LO, HSV_GREEN_HI, dst=mask_green)
+                cv2.inRange(hsv, HSV_RED_LO1, HSV_RED_HI1, dst=mask_red)
+                red_high = cv2.inRange(hsv, HSV_RED_LO2, HSV_RED_HI2, dst=self.detect_buffer('red_high', small_shape))
+                cv2.bitwise_or(mask_red, red_high, dst=mask_red)
+
+            return self.blocks_from_mask(mask_green, width, height), self.blocks_from_mask(mask_red, width, height)
+        except (cv2.error, ValueError):
+            return [], []
+
+    def detect_buffer(self, name, shape, dtype=np.uint8):
+        """Scratch array for block detection, reused while region sizes repeat"""
+        buf = self.detect_bufs.get(name)
+        if buf is None or buf.shape != shape or buf.dtype != dtype:
+            buf = np.empty(shape, dtype=dtype)
+            self.detect_bufs[name] = buf
+        return buf
+
+    def blocks_from_mask(self, mask, width, height):
+        """Bounding boxes of the mask's connected components, scaled to the full region, filtered and sorted top to bottom"""
+        cv2.morphologyEx(mask, cv2.MORPH_CLOSE, BLOCK_CLOSE_KERNEL, dst=mask)
+
+        labels = self.detect_buffer('labels', mask.shape, np.int32)
+        _, _, stats, _ = cv2.connectedComponentsWithStats(mask, labels=labels, connectivity=8)
+        stats = stats[1:] * self.DETECT_SCALE  # Label 0 is the background
+        x, y = stats[:, cv2.CC_STAT_LEFT], stats[:, cv2.CC_STAT_TOP]
+        w = np.minimum(stats[:, cv2.CC_STAT_WIDTH], width - x)  # Clamp to the region
+        h = np.minimum(stats[:, cv2.CC_STAT_HEIGHT], height - y)
+        area = stats[:, cv2.CC_STAT_AREA] * self.DETECT_SCALE
+
+        keep = (area > self.BLOCK_MIN_AREA) & (w > 35) & (h > 5)
+        boxes = np.column_stack((x, y, w, h))[keep]
+        boxes = boxes[np.argsort(boxes[:, 1], kind='stable')]
+
+        return [{'x': int(x), 'y': int(y), 'w': int(w), 'h': int(h)} for x, y, w, h in boxes]
+
+    def block_crop(self, region, block):
+        """Block region with a small padding (a view, no copy)"""
+        x, y, w, h = block['x'], block['y'], block['w'], block['h']
+        return region[max(0,y-3):y+h+3, max(0,x-3):x+w+3]
+
+    BLANK_BLOCK_STD = 6.0  # Gray std-dev inside a block below this = nothing printed on it
+
+    def is_blank_block(self, region_gray, block):
+        """True if the block's interior (edges excluded) is a flat color - nothing to OCR"""
+        x, y, w, h = block['x'], block['y'], block['w'], block['h']
+        interior = region_gray[y+3:y+h-3, x+3:x+w-3]
+        if interior.size == 0:
+            return False  # Too thin to judge; let OCR decide
+        return cv2.meanStdDev(interior)[1][0, 0] < self.BLANK_BLOCK_STD
+
+    def fast_text_from_block(self, region_gray, block):
+        """Fast text extraction (blank blocks skip OCR)"""
         try:
-            x, y, w, h = block['x'], block['y'], block['w'], block['h']
-            block_region = region_cv[max(0,y-3):y+h+3, max(0,x-3):x+w+3]  # Small padding
-            return self.fast_ocr(block_region)
-        except:
+            if self.is_blank_block(region_gray, block):
+                return "", 0
+            return self.fast_ocr(self.block_crop(region_gray, block))
+        except OCR_ERRORS:
             return "", 0
 
+    BATCH_SEPARATOR = 20  # White rows/columns around each block on the batch canvas
+
+    def batch_text_from_blocks(self, region_gray, blocks):
+        """
+        OCR all blocks with a single Tesseract pass (tesserocr canvas, or one
+        tesseract.exe run over an image list). Flat-color blocks are never sent to OCR.
+        Falls back to per-block OCR when the batch result can't be trusted
+        """
+        if len(blocks) < 2:
+            return self.per_block_texts(region_gray, blocks)
+
+        try:
+            results = [("", 0)] * len(blocks)
+            inked = [i for i, block in enumerate(blocks) if not self.is_blank_block(region_gray, block)]
+            if not inked:
+                return results
+
+            images = [self.prepare_ocr_image(self.block_crop(region_gray, blocks[i])) for i in inked]
+            if self.api is None:
+                texts = self.pytesseract_batch(images)
+            else:
+                texts = self.tesserocr_batch(images)
+
+            for i, text in zip(inked, texts):
+                results[i] = (text, 75)
+            return results
+        except (*OCR_ERRORS, ValueError):  # ValueError: batch output didn't map back to the blocks
+            return self.per_block_texts(region_gray, blocks)
+
+    def tesserocr_batch(self, images):
+        """
+        OCR several preprocessed images with one Recognize: they are stacked on a
+        white canvas and recognized lines are mapped back by vertical position
+        """
+        sep = self.BATCH_SEPARATOR
+        canvas_height = sum(image.shape[0] for image in images) + sep * (len(images) + 1)
+        canvas_width = max(image.shape[1] for image in images) + 2 * sep
+        canvas = np.full((canvas_height, canvas_width), 255, dtype=np.uint8)
+
+        spans = []
+        top = sep
+        for image in images:
+            canvas[top:top + image.shape[0], sep:sep + image.shape[1]] = image
+            spans.append((top, top + image.shape[0]))
+            top += image.shape[0] + sep
+
+        self.set_api_image(self.api, canvas)
+        self.api.Recognize()
+
+        image_lines = [[] for _ in images]
+        for line in iterate_level(self.api.GetIterator(), RIL.TEXTLINE):
+            text = line.GetUTF8Text(RIL.TEXTLINE).strip()
+            box = line.BoundingBox(RIL.TEXTLINE)
+            if not text or box is None:
+                continue
+            middle = (box[1] + box[3]) // 2
+            for i, (span_top, span_bottom) in enumerate(spans):
+                if span_top <= middle < span_bottom:
+                    image_lines[i].append(text)
+                    break
+
+        if not all(image_lines):
+            raise ValueError("batch OCR missed a block")
+
+        return ['\n'.join(lines) for lines in image_lines]
+
+    def per_block_texts(self, region_gray, blocks):
+        """
+        One OCR call per block; without tesserocr each call is its own tesseract.exe
+        process, so they run side by side (the shared Tesseract handle stays sequential)
+        """
+        if self.api is None and len(blocks) > 1:
+            return list(self.block_pool.map(lambda block: self.fast_text_from_block(region_gray, block), blocks))
+        return [self.fast_text_from_block(region_gray, block) for block in blocks]
+
+    def pytesseract_batch(self, images):
+        """OCR several preprocessed images with one tesseract.exe run (image list file, one page per image)"""
+        with tempfile.TemporaryDirectory(prefix="qa_ocr_") as tmp:
+            paths = []
+            for i, image in enumerate(images):
+                path = os.path.join(tmp, f"block_{i}.png")
+                cv2.imencode(".png", image)[1].tofile(path)  # imwrite can't handle non-ASCII paths on Windows
+                paths.append(path)
+
+            list_path = os.path.join(tmp, "blocks.txt")
+            with open(list_path, "w", encoding="utf-8") as f:
+                f.write("\n".join(paths) + "\n")
+
+            output = pytesseract.image_to_string(list_path, lang="srp+eng", config="--oem 1 --psm 6")
+
+        # Tesseract ends every page with a form feed
+        pages = output.split("\x0c")
+        if len(pages) < len(images):
+            raise ValueError("batch OCR page count mismatch")
+        return [page.strip() for page in pages[:len(images)]]
+
     def detect_question_type(self, text):
         """Fast type detection"""
-        match = re.search(r"Broj potrebnih odgovora:\s*(\d+)", text, re.IGNORECASE)
+        match = self.BROJ_RE.search(text)
         if match:
             self.question_type = "multi"
             self.required_correct_answers = int(match.group(1))
@@ -811,33 +1254,20 @@ Hotkeys: SPACE = Next question, ESC = Cancel current, 🛑 Stop = End session"""
 
     def update_answers_fast(self):
         """Fast answer display update"""
-        self.correct_answers_list.delete(1.0, tk.END)
-        for i, ans in enumerate(self.correct_answers, 1):
-            self.correct_answers_list.insert(tk.END, f"{i}. {ans['text']}\n")
+        self.render_answers(self.correct_answers_list, self.correct_answers)
+        self.render_answers(self.wrong_answers_list, self.wrong_answers)
 
-        self.wrong_answers_list.delete(1.0, tk.END)
-        for i, ans in enumerate(self.wrong_answers, 1):
-            self.wrong_answers_list.insert(tk.END, f"{i}. {ans['text']}\n")
+    def render_answers(self, widget, answers):
+        """Replace widget's content with the numbered answers in one insert"""
+        widget.delete(1.0, tk.END)
+        if answers:
+            widget.insert(tk.END, "".join(f"{i}. {ans['text']}\n" for i, ans in enumerate(answers, 1)))
 
     def save_qa_set_silent(self):
         """Silent auto-save for continuous mode"""
         start_time = time.time()
 
         try:
-            # Load existing data
-            data = {"questions": []}
-            if os.path.exists(self.json_file):
-                try:
-                    with open(self.json_file, "r", encoding="utf-8") as f:
-                        content = f.read().strip()
-                        if content:
-                            data = json.loads(content)
-                except:
-                    data = {"questions": []}
-
-            if "questions" not in data:
-                data["questions"] = []
-
             # Create entry
             qa_entry = {
                 "id": self.question_counter,
@@ -852,11 +1282,10 @@ Hotkeys: SPACE = Next question, ESC = Cancel current, 🛑 Stop = End session"""
                 "total_answers": len(self.correct_answers) + len(self.wrong_answers)
             }
 
-            data["questions"].append(qa_entry)
-
-            # Save
-            with open(self.json_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            # Save: append one line instead of rewriting the whole file
+            if self.jsonl_handle is None:
+                self.jsonl_handle = open(self.jsonl_file, "a", encoding="utf-8", buffering=1)
+            self.jsonl_handle.write(json_dumps(qa_entry) + "\n")
 
             # Update counter and display
             save_time = time.time() - start_time
@@ -865,7 +1294,8 @@ Hotkeys: SPACE = Next question, ESC = Cancel current, 🛑 Stop = End session"""
             # Update UI for continuous mode
             session_count = self.question_counter - 1
             self.counter_label.config(text=f"Session: {session_count} saved")
-            self.update_data_display()
+            self.recent_questions.append(qa_entry)
+            self.update_data_display(new_entry=qa_entry)
 
             # Show success and prepare for next
             success_msg = f"✅ Q&A #{qa_entry['id']} auto-saved! ({save_time:.1f}s)"
@@ -874,7 +1304,7 @@ Hotkeys: SPACE = Next question, ESC = Cancel current, 🛑 Stop = End session"""
             # Prepare for next question
             self.prepare_for_next_question()
 
-        except Exception as e:
+        except (OSError, ValueError, TypeError) as e:
             messagebox.showerror("Auto-Save Error", f"Could not save Q&A: {e}")
 
     def prepare_for_next_question(self):
@@ -887,42 +1317,153 @@ Hotkeys: SPACE = Next question, ESC = Cancel current, 🛑 Stop = End session"""
         self.phase_label.config(text="READY FOR NEXT", foreground="green")
         self.update_status("Press SPACE to start next question")
 
-    def load_existing_data_robust(self):
-        """Robust data loading"""
+    def load_json_data(self, strict=False):
+        """
+        Robust load of the compacted JSON file
+        strict=True: an existing file that can't be read or isn't a {"questions": [...]}
+        object raises OSError/ValueError instead of coming back empty (for writers)
+        """
+        data = {"questions": []}
         if os.path.exists(self.json_file):
             try:
                 with open(self.json_file, "r", encoding="utf-8") as f:
                     content = f.read().strip()
                     if content:
-                        data = json.loads(content)
-                        if "questions" in data and isinstance(data["questions"], list) and data["questions"]:
-                            self.question_counter = max(q.get("id", 0) for q in data["questions"]) + 1
-                        self.update_data_display()
-            except:
-                pass
+                        data = json_loads(content)
+            except (OSError, ValueError):
+                if strict:
+                    raise
+                data = {"questions": []}
+
+        if strict and not (isinstance(data, dict) and isinstance(data.get("questions", []), list)):
+            raise ValueError(f"{self.json_file} is not a {{\"questions\": [...]}} object")
+        if not isinstance(data, dict):
+            data = {"questions": []}
+        if not isinstance(data.get("questions"), list):
+            data["questions"] = []
+        return data
+
+    def iter_jsonl_questions(self):
+        """Stream the records appended since the last compaction"""
+        if not os.path.exists(self.jsonl_file):
+            return
+        with open(self.jsonl_file, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    try:
+                        record = json_loads(line)
+                    except ValueError:
+                        continue  # Torn last line after a crash
+                    yield record
+
+    def iter_saved_questions(self):
+        """All saved Q&A records: compacted JSON first, then the JSONL tail"""
+        yield from self.load_json_data()["questions"]
+        yield from self.iter_jsonl_questions()
+
+    def compact_saved_questions(self):
+        """Fold qa_data.jsonl into qa_data.json (one rewrite per session instead of per save)"""
+        if self.jsonl_handle is not None:
+            self.jsonl_handle.close()
+            self.jsonl_handle = None
+
+        if not os.path.exists(self.jsonl_file):
+            return
 
-    def update_data_display(self):
-        """Update data display"""
-        self.data_display.delete(1.0, tk.END)
+        try:
+            # Unreadable JSON file: leave both files alone rather than rewrite it
+            # with only the JSONL records
+            data = self.load_json_data(strict=True)
+            new_questions = list(self.iter_jsonl_questions())
+
+            # Append in place when possible; otherwise rewrite the whole file
+            if new_questions and not self.append_to_json_file(data, new_questions):
+                data["questions"].extend(new_questions)
+                with open(self.json_file, "w", encoding="utf-8") as f:
+                    f.write(json_dumps(data, indent=True))
+
+            os.remove(self.jsonl_file)
+        except (OSError, ValueError) as e:
+            print(f"Compaction skipped, {self.jsonl_file} kept: {e}")
+            self.update_status(f"⚠️ Could not merge {self.jsonl_file} into {self.json_file} ({e}); kept both")
+
+    def append_to_json_file(self, data, new_questions):
+        """
+        Append records to the "questions" array at the end of json_file without
+        re-serializing the existing ones; the bytes match a full json.dump(indent=2)
+        rewrite. Returns False (file untouched) when the file isn't in that shape
+        """
+        questions = data["questions"]
+        if not questions or not isinstance(questions[-1], dict) or next(reversed(data)) != "questions":
+            return False
+
+        with open(self.json_file, "r+b") as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            f.seek(max(0, size - 32))
+            tail = f.read()
+
+            # json.dump(indent=2) closes a non-empty "questions" array of objects like this
+            # (text mode on Windows writes \r\n)
+            for newline in ("\n", "\r\n"):
+                if tail.endswith(f"{newline}    }}{newline}  ]{newline}}}".encode("utf-8")):
+                    break
+            else:
+                return False
 
-        if os.path.exists(self.json_file):
-            try:
-                with open(self.json_file, "r", encoding="utf-8") as f:
-                    content = f.read().strip()
-                    if content:
-                        data = json.loads(content)
-
-                        if "questions" in data and isinstance(data["questions"], list):
-                            # Show recent questions
-                            for q in data["questions"][-5:]:
-                                qtype = q.get('question_type', '?')
-                                correct = q.get('total_correct', 0)
-                                wrong = q.get('total_wrong', 0)
-
-                                line = f"Q{q.get('id', '?')} - {qtype.upper()} (✅{correct} ❌{wrong}) - {q.get('question', '')[:45]}...\n"
-                                self.data_display.insert(tk.END, line)
-            except:
-                pass
+            entries = "".join(
+                f",{newline}" + newline.join("    " + line for line in
+                                             json_dumps(q, indent=True).split("\n"))
+                for q in new_questions)
+
+            f.seek(size - len(f"{newline}  ]{newline}}}"))
+            f.write(f"{entries}{newline}  ]{newline}}}".encode("utf-8"))
+            f.truncate()
+        return True
+
+    def load_existing_data_robust(self):
+        """Robust data loading"""
+        # Recover records left in the JSONL by a session that did not stop cleanly
+        self.compact_saved_questions()
+
+        try:
+            last_id = 0
+            for q in self.iter_saved_questions():
+                last_id = max(last_id, q.get("id", 0))
+                self.recent_questions.append(q)
+            self.question_counter = last_id + 1
+            self.update_data_display()
+        except (OSError, ValueError, TypeError, AttributeError):
+            pass
+
+    def update_data_display(self, new_entry=None):
+        """
+        Update data display from the in-memory recent records (no disk reads).
+        With new_entry, only its line is added and the oldest one scrolled out
+        """
+        try:
+            if new_entry is not None:
+                self.data_display.insert(tk.END, self.data_display_line(new_entry))
+                shown = int(self.data_display.index("end-1c").split(".")[0]) - 1
+                if shown > self.recent_questions.maxlen:
+                    self.data_display.delete("1.0", f"{shown - self.recent_questions.maxlen + 1}.0")
+                return
+
+            # Show recent questions
+            self.data_display.delete(1.0, tk.END)
+            self.data_display.insert(tk.END, "".join(map(self.data_display_line, self.recent_questions)))
+        except tk.TclError:
+            pass
+
+    def data_display_line(self, q):
+        """One summary line of the data display (exactly one text line per record)"""
+        qtype = q.get('question_type', '?')
+        correct = q.get('total_correct', 0)
+        wrong = q.get('total_wrong', 0)
+        question = q.get('question', '')[:45].replace("\n", " ")
+
+        return f"Q{q.get('id', '?')} - {qtype.upper()} (✅{correct} ❌{wrong}) - {question}...\n"
 
 def main():
     root = tk.Tk()
@@ -933,10 +1474,17 @@ def main():
     except KeyboardInterrupt:
         pass
     finally:
-        try:
-            keyboard.unhook_all()
-        except:
-            pass
+        if KEYBOARD_AVAILABLE:
+            try:
+                keyboard.unhook_all()
+            except Exception:
+                pass
+        app.ocr_executor.shutdown(wait=True)
+        app.block_pool.shutdown(wait=True)
+        app.close_ocr()
+        app.compact_saved_questions()
+        if app.sct is not None:
+            app.sct.close()
 
 if __name__ == "__main__":
     main()
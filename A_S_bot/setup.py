@@ -0,0 +1,25 @@
+"""
+Setup script for building the optional Cython extension used by main.py
+main.py falls back to pure Python when it is not built
+
+Usage:
+    pip install cython
+    python setup.py build_ext --inplace
+"""
+
+from setuptools import setup, Extension
+from Cython.Build import cythonize
+
+ext_fast_clean = Extension(
+    'fast_clean',
+    sources=['fast_clean.pyx'],
+)
+
+setup(
+    name='auto_test_corrector_fast_clean',
+    version='2.0',
+    description='Compiled OCR text cleaning for the answer hot path',
+    ext_modules=cythonize([ext_fast_clean], language_level=3),
+    zip_safe=False,
+    python_requires='>=3.10',
+)
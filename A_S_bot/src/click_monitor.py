@@ -5,7 +5,7 @@ Monitors mouse position and identifies clicks within the answer area
 
 import time
 from pynput import mouse
-from fuzzywuzzy import fuzz
+from rapidfuzz import fuzz
 
 
 class ClickMonitor:
@@ -261,7 +261,7 @@ class QuestionnaireHelper:
 
     def _fuzzy_match(self, text1, text2, threshold=80):
         """Check if two texts match using fuzzy matching"""
-        from fuzzywuzzy import fuzz
+        from rapidfuzz import fuzz
         score = fuzz.ratio(text1.lower(), text2.lower())
         return score >= threshold
 
@@ -3,7 +3,7 @@ Question Database - Read-only database access wrapper
 Provides read-only access to questions and answers
 """
 
-from fuzzywuzzy import fuzz
+from rapidfuzz import fuzz
 import sys
 import os
 
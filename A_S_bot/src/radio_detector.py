@@ -488,7 +488,7 @@ def find_answer_by_text(target_text, answers, threshold=80):
         return None
 
     try:
-        from fuzzywuzzy import fuzz
+        from rapidfuzz import fuzz
     except ImportError:
         # Fallback to simple matching
         target_lower = target_text.lower()